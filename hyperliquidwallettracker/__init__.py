@@ -18,10 +18,16 @@ __version__ = "1.0.0"
 __author__ = "JDENNO91"
 __email__ = "jdenno91@example.com"
 
-from .core.monitor import HyperLiquidWalletTracker
-from .core.config import HyperLiquidConfig
-from .alerts.engine import AlertEngine
-from .notifications.dispatcher import NotificationDispatcher
+import importlib
+
+# Public names resolved on first access, so importing a submodule such as the
+# CLI does not pull in the monitor and its network stack
+_LAZY_EXPORTS = {
+    "HyperLiquidWalletTracker": ".core.monitor",
+    "HyperLiquidConfig": ".core.config",
+    "AlertEngine": ".alerts.engine",
+    "NotificationDispatcher": ".notifications.dispatcher",
+}
 
 __all__ = [
     "HyperLiquidWalletTracker",
@@ -29,3 +35,12 @@ __all__ = [
     "AlertEngine",
     "NotificationDispatcher",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
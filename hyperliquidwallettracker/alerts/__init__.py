@@ -7,13 +7,14 @@ formatters for processing Hyperliquid events and generating alerts.
 
 from .engine import AlertEngine
 from .rules import AlertRule, DEFAULT_RULES
-from .formatter import NotificationFormatter
+from .formatter import Notification, NotificationFormatter
 from .classifier import PositionClassifier
 
 __all__ = [
     "AlertEngine",
     "AlertRule", 
     "DEFAULT_RULES",
+    "Notification",
     "NotificationFormatter",
     "PositionClassifier",
 ]
@@ -5,7 +5,10 @@ This module provides intelligent position classification based on USD value
 with configurable thresholds and additional context analysis.
 """
 
-from typing import Optional, Dict, Any
+import sys
+from bisect import bisect_right
+from collections import Counter, deque
+from typing import Optional, Dict, Any, Deque, Iterable, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -14,14 +17,43 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Candidate event field names, interned so dict probes hit the identity fast path
+_USD_FIELDS = tuple(sys.intern(f) for f in (
+    "usd_value", "usdValue", "value_usd", "valueUSD",
+    "total_value", "totalValue", "amount_usd", "amountUSD"
+))
+_PRICE_FIELDS = tuple(sys.intern(f) for f in ("price", "limitPx", "limit_px", "execution_price"))
+_SIZE_FIELDS = tuple(sys.intern(f) for f in ("size", "sz", "quantity", "amount", "volume"))
 
-class PositionSize(Enum):
-    """Position size classifications."""
+
+class PositionSize(str, Enum):
+    """
+    Position size classifications.
+    
+    Members are strings, so they can be used directly as metric labels and
+    dict keys without going through ``.value``. Hashing uses ``str.__hash__``,
+    which gives the same values as ``Enum.__hash__`` (names equal values)
+    without the Python-level call.
+    """
     WHALE = "WHALE"
     LARGE = "LARGE" 
     MEDIUM = "MEDIUM"
     NOTABLE = "NOTABLE"
     SMALL = "SMALL"
+    
+    __str__ = str.__str__
+    __format__ = str.__format__
+    __hash__ = str.__hash__
+
+
+# Size classes ordered to match the ascending threshold bounds used for batches
+_SIZES_ASCENDING = (
+    PositionSize.SMALL,
+    PositionSize.NOTABLE,
+    PositionSize.MEDIUM,
+    PositionSize.LARGE,
+    PositionSize.WHALE,
+)
 
 
 @dataclass
@@ -54,7 +86,8 @@ class PositionClassifier:
             thresholds: Position size thresholds
         """
         self.thresholds = thresholds
-        self.classification_history: Dict[str, list] = {}
+        self.classification_history: Dict[str, Deque[PositionSize]] = {}
+        self.max_history_per_wallet = 100
     
     def classify_position(self, event: Dict[str, Any]) -> Optional[PositionSize]:
         """
@@ -66,27 +99,75 @@ class PositionClassifier:
         Returns:
             Position size classification or None if not applicable
         """
-        try:
-            # Extract USD value
-            usd_value = self._extract_usd_value(event)
-            if usd_value is None or usd_value <= 0:
-                return None
-            
-            # Classify based on thresholds
-            if usd_value >= self.thresholds.whale_threshold:
-                return PositionSize.WHALE
-            elif usd_value >= self.thresholds.large_threshold:
-                return PositionSize.LARGE
-            elif usd_value >= self.thresholds.medium_threshold:
-                return PositionSize.MEDIUM
-            elif usd_value >= self.thresholds.notable_threshold:
-                return PositionSize.NOTABLE
-            else:
-                return PositionSize.SMALL
-                
-        except Exception as e:
-            logger.error(f"Error classifying position: {e}")
+        # Extract USD value
+        usd_value = self._extract_usd_value(event)
+        if usd_value is None or usd_value <= 0:
             return None
+        
+        return self._classify_usd_value(usd_value)
+    
+    def _classify_usd_value(self, usd_value: float) -> PositionSize:
+        """Classify an already extracted USD value against the thresholds."""
+        if usd_value >= self.thresholds.whale_threshold:
+            return PositionSize.WHALE
+        elif usd_value >= self.thresholds.large_threshold:
+            return PositionSize.LARGE
+        elif usd_value >= self.thresholds.medium_threshold:
+            return PositionSize.MEDIUM
+        elif usd_value >= self.thresholds.notable_threshold:
+            return PositionSize.NOTABLE
+        else:
+            return PositionSize.SMALL
+    
+    def classify_batch(
+        self,
+        usd_values: Iterable[Optional[float]]
+    ) -> List[Optional[PositionSize]]:
+        """
+        Classify many USD values at once.
+        
+        The thresholds are read once per batch and each value is placed with a
+        binary search, which is cheaper than the per-event path when replaying
+        or backfilling events.
+        
+        Args:
+            usd_values: USD values to classify (None or non-positive values are skipped)
+            
+        Returns:
+            Position size classification per value, None where not applicable
+        """
+        bounds = (
+            self.thresholds.notable_threshold,
+            self.thresholds.medium_threshold,
+            self.thresholds.large_threshold,
+            self.thresholds.whale_threshold,
+        )
+        
+        return [
+            _SIZES_ASCENDING[bisect_right(bounds, usd_value)]
+            if usd_value is not None and usd_value > 0 else None
+            for usd_value in usd_values
+        ]
+    
+    def classify_events(
+        self,
+        events: List[Dict[str, Any]]
+    ) -> List[Tuple[Optional[PositionSize], Optional[float]]]:
+        """
+        Classify a batch of events.
+        
+        Args:
+            events: Events containing position information
+            
+        Returns:
+            (size class, USD value) per event, both None where not applicable
+        """
+        usd_values = [self._extract_usd_value(event) for event in events]
+        
+        return [
+            (size_class, usd_value if size_class is not None else None)
+            for size_class, usd_value in zip(self.classify_batch(usd_values), usd_values)
+        ]
     
     def analyze_position(self, event: Dict[str, Any]) -> Optional[PositionAnalysis]:
         """
@@ -98,56 +179,64 @@ class PositionClassifier:
         Returns:
             Detailed position analysis or None if not applicable
         """
-        try:
-            # Extract basic information
-            usd_value = self._extract_usd_value(event)
-            if usd_value is None or usd_value <= 0:
-                return None
-            
-            # Classify position
-            size_class = self.classify_position(event)
-            if size_class is None:
-                return None
-            
-            # Calculate confidence
-            confidence = self._calculate_confidence(event, usd_value)
-            
-            # Analyze factors
-            factors = self._analyze_factors(event, usd_value)
-            
-            # Generate recommendation
-            recommendation = self._generate_recommendation(size_class, usd_value, factors)
-            
-            return PositionAnalysis(
-                size_class=size_class,
-                usd_value=usd_value,
-                confidence=confidence,
-                factors=factors,
-                recommendation=recommendation
-            )
-            
-        except Exception as e:
-            logger.error(f"Error analyzing position: {e}")
+        # Extract basic information once and reuse it below
+        price = self._extract_price(event)
+        size = self._extract_size(event)
+        usd_value = self._extract_usd_value(event, price, size)
+        if usd_value is None or usd_value <= 0:
             return None
+        
+        # Classify position
+        size_class = self._classify_usd_value(usd_value)
+        
+        # Calculate confidence
+        confidence = self._calculate_confidence(usd_value, price, size)
+        
+        # Analyze factors
+        factors = self._analyze_factors(event, usd_value, price, size)
+        
+        # Generate recommendation
+        recommendation = self._generate_recommendation(size_class, usd_value, factors)
+        
+        return PositionAnalysis(
+            size_class=size_class,
+            usd_value=usd_value,
+            confidence=confidence,
+            factors=factors,
+            recommendation=recommendation
+        )
     
-    def _extract_usd_value(self, event: Dict[str, Any]) -> Optional[float]:
-        """Extract USD value from event data."""
-        # Try different field names for USD value
-        usd_fields = [
-            "usd_value", "usdValue", "value_usd", "valueUSD",
-            "total_value", "totalValue", "amount_usd", "amountUSD"
-        ]
+    def _extract_usd_value(
+        self,
+        event: Dict[str, Any],
+        price: Optional[float] = None,
+        size: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Extract USD value from event data.
         
-        for field in usd_fields:
-            if field in event and event[field] is not None:
+        Args:
+            event: Event data containing position information
+            price: Price already extracted by the caller, if any
+            size: Size already extracted by the caller, if any
+            
+        Returns:
+            USD value or None if it cannot be determined
+        """
+        # Try different field names for USD value
+        for field in _USD_FIELDS:
+            value = event.get(field)
+            if value is not None:
                 try:
-                    return float(event[field])
+                    return float(value)
                 except (ValueError, TypeError):
                     continue
         
         # Try to calculate from price and size
-        price = self._extract_price(event)
-        size = self._extract_size(event)
+        if price is None:
+            price = self._extract_price(event)
+        if size is None:
+            size = self._extract_size(event)
         
         if price is not None and size is not None:
             return float(price) * float(size)
@@ -156,12 +245,11 @@ class PositionClassifier:
     
     def _extract_price(self, event: Dict[str, Any]) -> Optional[float]:
         """Extract price from event data."""
-        price_fields = ["price", "limitPx", "limit_px", "execution_price"]
-        
-        for field in price_fields:
-            if field in event and event[field] is not None:
+        for field in _PRICE_FIELDS:
+            value = event.get(field)
+            if value is not None:
                 try:
-                    return float(event[field])
+                    return float(value)
                 except (ValueError, TypeError):
                     continue
         
@@ -169,23 +257,27 @@ class PositionClassifier:
     
     def _extract_size(self, event: Dict[str, Any]) -> Optional[float]:
         """Extract size from event data."""
-        size_fields = ["size", "sz", "quantity", "amount", "volume"]
-        
-        for field in size_fields:
-            if field in event and event[field] is not None:
+        for field in _SIZE_FIELDS:
+            value = event.get(field)
+            if value is not None:
                 try:
-                    return float(event[field])
+                    return float(value)
                 except (ValueError, TypeError):
                     continue
         
         return None
     
-    def _calculate_confidence(self, event: Dict[str, Any], usd_value: float) -> float:
+    def _calculate_confidence(
+        self,
+        usd_value: float,
+        price: Optional[float],
+        size: Optional[float]
+    ) -> float:
         """Calculate confidence score for position classification."""
         confidence = 1.0
         
         # Reduce confidence if price or size is missing
-        if self._extract_price(event) is None or self._extract_size(event) is None:
+        if price is None or size is None:
             confidence *= 0.8
         
         # Reduce confidence for very small values
@@ -198,20 +290,26 @@ class PositionClassifier:
         
         return max(0.0, min(1.0, confidence))
     
-    def _analyze_factors(self, event: Dict[str, Any], usd_value: float) -> Dict[str, Any]:
+    def _analyze_factors(
+        self,
+        event: Dict[str, Any],
+        usd_value: float,
+        price: Optional[float],
+        size: Optional[float]
+    ) -> Dict[str, Any]:
         """Analyze additional factors that might affect the position."""
         factors = {
             "usd_value": usd_value,
             "coin": event.get("coin", "unknown"),
             "side": event.get("side", "unknown"),
             "order_type": event.get("orderType", "unknown"),
-            "has_price": self._extract_price(event) is not None,
-            "has_size": self._extract_size(event) is not None,
+            "has_price": price is not None,
+            "has_size": size is not None,
         }
         
         # Add market context if available
-        if "market_data" in event:
-            market_data = event["market_data"]
+        market_data = event.get("market_data")
+        if isinstance(market_data, dict):
             factors.update({
                 "market_cap": market_data.get("market_cap"),
                 "volume_24h": market_data.get("volume_24h"),
@@ -250,23 +348,18 @@ class PositionClassifier:
     
     def get_classification_stats(self) -> Dict[str, int]:
         """Get statistics on position classifications."""
-        stats = {size.value: 0 for size in PositionSize}
-        
-        # Count classifications from history
-        for wallet, history in self.classification_history.items():
-            for classification in history:
-                if classification in stats:
-                    stats[classification] += 1
+        counts: Counter = Counter()
+        for history in self.classification_history.values():
+            counts.update(history)
         
-        return stats
+        return {size: counts[size] for size in PositionSize}
     
     def track_classification(self, wallet: str, classification: PositionSize):
         """Track classification for statistics."""
-        if wallet not in self.classification_history:
-            self.classification_history[wallet] = []
-        
-        self.classification_history[wallet].append(classification.value)
+        history = self.classification_history.get(wallet)
+        if history is None:
+            # Bounded deque keeps only the most recent classifications per wallet
+            history = deque(maxlen=self.max_history_per_wallet)
+            self.classification_history[wallet] = history
         
-        # Keep only last 100 classifications per wallet
-        if len(self.classification_history[wallet]) > 100:
-            self.classification_history[wallet] = self.classification_history[wallet][-100:]
+        history.append(classification)
@@ -6,18 +6,51 @@ events against rules and triggers notifications.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional, Callable
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Mapping, Tuple
 from datetime import datetime, timezone
 
 from .rules import RulesEngine, AlertRule
 from .classifier import PositionClassifier, PositionSize
-from .formatter import NotificationFormatter, NotificationContext
+from .formatter import Notification, NotificationFormatter, NotificationContext
 from ..utils.logging import get_logger
 from ..utils.metrics import metrics_collector
 
 logger = get_logger(__name__)
 
 
+def _fingerprint_value(value: Any, numeric: bool = False) -> Any:
+    """
+    Normalize an event field for use in a dedup fingerprint.
+    
+    Numeric fields are compared as floats, so ``"100"`` and ``100`` are the
+    same event. Values that cannot be hashed are replaced by their ``repr``.
+    
+    Args:
+        value: Field value from the event
+        numeric: Whether the field holds a number such as a size or price
+        
+    Returns:
+        Hashable value with the intended equality
+    """
+    if value is None:
+        return None
+    if numeric and not isinstance(value, bool):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            # NaN never equals itself, which would defeat deduplication
+            return number if number == number else "nan"
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
 class AlertEngine:
     """
     Core alert engine for processing events and triggering notifications.
@@ -57,10 +90,19 @@ class AlertEngine:
             "errors": 0,
             "start_time": datetime.now(timezone.utc)
         }
+        # Monotonic twin of start_time used for uptime, immune to wall clock jumps
+        self._start_monotonic = time.monotonic()
         
-        # Event deduplication
-        self.recent_events: Dict[str, datetime] = {}
+        # Event deduplication (fingerprint -> monotonic last seen, oldest first)
+        self.recent_events: "OrderedDict[Tuple[Any, ...], float]" = OrderedDict()
         self.dedup_window_seconds = 30
+        
+        # Event metrics aggregated locally and flushed to the collector periodically
+        self._pending_metrics: Counter = Counter()
+        self._last_metrics_flush = time.monotonic()
+        self.metrics_flush_interval = 1.0
+        # One-shot timer flushing counts that no later event would flush
+        self._metrics_flush_handle: Optional[asyncio.TimerHandle] = None
     
     def set_notification_handler(self, handler: Callable):
         """
@@ -72,7 +114,7 @@ class AlertEngine:
         self.notification_handler = handler
         logger.info("Notification handler set")
     
-    async def process_event(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def process_event(self, event: Dict[str, Any]) -> List[Notification]:
         """
         Process an event and generate notifications.
         
@@ -90,149 +132,267 @@ class AlertEngine:
                 logger.debug("Skipping duplicate event")
                 return []
             
-            # Classify position if classifier is available
-            position_analysis = None
-            if self.position_classifier:
-                position_analysis = self.position_classifier.analyze_position(event)
-                if position_analysis:
-                    # Track classification
-                    self.position_classifier.track_classification(
-                        event.get("wallet", "unknown"),
-                        position_analysis.size_class
-                    )
-            
-            # Evaluate rules
+            # Evaluate rules before doing any classification work
             triggered_rules = self.rules_engine.evaluate_event(event)
             
             if not triggered_rules:
                 logger.debug("No rules triggered for event")
                 return []
             
-            # Generate notifications
-            notifications = []
-            for rule in triggered_rules:
-                notification = await self._create_notification(event, rule, position_analysis)
-                if notification:
-                    notifications.append(notification)
+            # Classify position if classifier is available
+            size_class = None
+            usd_value = None
+            if self.position_classifier:
+                size_class, usd_value = self.position_classifier.classify_events([event])[0]
             
-            # Update stats
-            self.stats["alerts_triggered"] += len(triggered_rules)
-            self.stats["notifications_sent"] += len(notifications)
+            return self._create_notifications(event, triggered_rules, size_class, usd_value)
             
-            # Record metrics
-            metrics_collector.record_event_processed(
-                event_type=event.get("type", "unknown"),
-                wallet=event.get("wallet", "unknown"),
-                status="success"
-            )
+        except Exception:
+            self._record_event_error(event)
+            return []
+    
+    async def process_events(self, events: List[Dict[str, Any]]) -> List[Notification]:
+        """
+        Process a batch of events and generate notifications.
+        
+        Deduplication runs over the whole batch up front and only the events
+        that trigger rules are classified, in a single pass, which amortizes
+        per-event overhead when bursts of events arrive together.
+        
+        Args:
+            events: Event data to process, in arrival order
             
-            if position_analysis:
-                metrics_collector.record_position_event(
-                    size_class=position_analysis.size_class.value,
-                    coin=event.get("coin", "unknown")
+        Returns:
+            List of generated notifications for the whole batch
+        """
+        self.stats["events_processed"] += len(events)
+        
+        # Drop duplicates up front, including duplicates within the batch
+        fresh_events = []
+        for event in events:
+            try:
+                if self._is_duplicate_event(event):
+                    continue
+            except Exception:
+                self._record_event_error(event)
+                continue
+            fresh_events.append(event)
+        
+        if len(fresh_events) < len(events):
+            logger.debug("Skipped %d duplicate events", len(events) - len(fresh_events))
+        
+        # Evaluate rules for the whole batch, keeping only events that triggered something
+        try:
+            batch_results = self.rules_engine.evaluate_events(fresh_events)
+        except Exception:
+            for event in fresh_events:
+                self._record_event_error(event)
+            batch_results = []
+        
+        triggered = [
+            (event, triggered_rules)
+            for event, triggered_rules in zip(fresh_events, batch_results)
+            if triggered_rules
+        ]
+        
+        # Classify the triggered events at once if classifier is available
+        if self.position_classifier:
+            classifications = self.position_classifier.classify_events(
+                [event for event, _ in triggered]
+            )
+        else:
+            classifications = [(None, None)] * len(triggered)
+        
+        notifications = []
+        for (event, triggered_rules), (size_class, usd_value) in zip(triggered, classifications):
+            try:
+                notifications.extend(
+                    self._create_notifications(event, triggered_rules, size_class, usd_value)
                 )
-            
-            logger.info(f"Processed event: {len(triggered_rules)} rules triggered, {len(notifications)} notifications generated")
-            
-            return notifications
-            
-        except Exception as e:
-            self.stats["errors"] += 1
-            logger.error(f"Error processing event: {e}")
-            
-            # Record error metrics
+            except Exception:
+                self._record_event_error(event)
+        
+        self.flush_metrics()
+        
+        return notifications
+    
+    def _create_notifications(
+        self,
+        event: Dict[str, Any],
+        triggered_rules: List[AlertRule],
+        size_class: Optional[PositionSize],
+        usd_value: Optional[float]
+    ) -> List[Notification]:
+        """Build notifications for an event that triggered at least one rule."""
+        if size_class is not None:
+            # Track classification
+            self.position_classifier.track_classification(
+                event.get("wallet", "unknown"),
+                size_class
+            )
+        
+        # Context and formatted payloads only depend on the event, so
+        # build them once and share them across all triggered rules
+        context = self._create_notification_context(event, size_class, usd_value)
+        formatted = self.notification_formatter.format_notification(context, event)
+        
+        # Generate notifications
+        notifications = [
+            self._create_notification(event, rule, context, formatted, context.timestamp_iso)
+            for rule in triggered_rules
+        ]
+        
+        # Update stats
+        self.stats["alerts_triggered"] += len(triggered_rules)
+        self.stats["notifications_sent"] += len(notifications)
+        
+        # Record metrics
+        self._record_event_metric(event, "success")
+        
+        if size_class is not None:
+            metrics_collector.record_position_event(
+                size_class=size_class,
+                coin=event.get("coin", "unknown")
+            )
+        
+        logger.info(
+            "Processed event: %d rules triggered, %d notifications generated",
+            len(triggered_rules),
+            len(notifications)
+        )
+        
+        return notifications
+    
+    def _record_event_error(self, event: Dict[str, Any]):
+        """Record a failure to process an event; must be called from an except block."""
+        self.stats["errors"] += 1
+        logger.error("Error processing event", exc_info=True)
+        
+        # Record error metrics
+        self._record_event_metric(event, "error")
+    
+    def _record_event_metric(self, event: Dict[str, Any], status: str):
+        """Count a processed event locally, flushing to the collector when due."""
+        self._pending_metrics[
+            (event.get("type", "unknown"), event.get("wallet", "unknown"), status)
+        ] += 1
+        
+        elapsed = time.monotonic() - self._last_metrics_flush
+        if elapsed >= self.metrics_flush_interval:
+            self.flush_metrics()
+        elif self._metrics_flush_handle is None:
+            # Make sure these counts are reported even if no event follows
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._metrics_flush_handle = loop.call_later(
+                self.metrics_flush_interval - elapsed, self.flush_metrics
+            )
+    
+    def flush_metrics(self):
+        """Flush locally aggregated event counts to the metrics collector."""
+        if self._metrics_flush_handle is not None:
+            self._metrics_flush_handle.cancel()
+            self._metrics_flush_handle = None
+        
+        pending = self._pending_metrics
+        self._pending_metrics = Counter()
+        self._last_metrics_flush = time.monotonic()
+        
+        for (event_type, wallet, status), count in pending.items():
             metrics_collector.record_event_processed(
-                event_type=event.get("type", "unknown"),
-                wallet=event.get("wallet", "unknown"),
-                status="error"
+                event_type=event_type,
+                wallet=wallet,
+                status=status,
+                count=count
             )
-            
-            return []
     
     def _is_duplicate_event(self, event: Dict[str, Any]) -> bool:
         """Check if event is a duplicate within the deduplication window."""
         # Create event fingerprint
         fingerprint = self._create_event_fingerprint(event)
         
-        now = datetime.now(timezone.utc)
+        # Dedup windows are relative, so a monotonic clock is sufficient
+        now = time.monotonic()
         
         # Check if we've seen this event recently
-        if fingerprint in self.recent_events:
-            last_seen = self.recent_events[fingerprint]
-            if (now - last_seen).total_seconds() < self.dedup_window_seconds:
-                return True
+        last_seen = self.recent_events.get(fingerprint)
+        if last_seen is not None and now - last_seen < self.dedup_window_seconds:
+            return True
         
-        # Update event tracking
+        # Update event tracking, keeping the newest entry at the end
         self.recent_events[fingerprint] = now
+        self.recent_events.move_to_end(fingerprint)
         
-        # Clean up old events
-        cutoff = now.timestamp() - self.dedup_window_seconds * 2
-        self.recent_events = {
-            fp: timestamp for fp, timestamp in self.recent_events.items()
-            if timestamp.timestamp() > cutoff
-        }
+        # Clean up old events from the front of the FIFO
+        cutoff = now - self.dedup_window_seconds * 2
+        while self.recent_events and next(iter(self.recent_events.values())) <= cutoff:
+            self.recent_events.popitem(last=False)
         
         return False
     
-    def _create_event_fingerprint(self, event: Dict[str, Any]) -> str:
-        """Create a fingerprint for event deduplication."""
-        # Use key fields to create fingerprint
-        key_fields = [
-            event.get("type"),
-            event.get("wallet"),
-            event.get("coin"),
-            event.get("side"),
-            str(event.get("usd_value", "")),
-            str(event.get("size", "")),
-            str(event.get("price", ""))
-        ]
+    def _create_event_fingerprint(self, event: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Create a fingerprint for event deduplication.
+        
+        The tuple of key fields is hashed directly by the dedup dict, so no
+        joined string is built per event. Fields are normalized by
+        ``_fingerprint_value``.
+        """
+        get = event.get
+        return (
+            _fingerprint_value(get("type")),
+            _fingerprint_value(get("wallet")),
+            _fingerprint_value(get("coin")),
+            _fingerprint_value(get("side")),
+            _fingerprint_value(get("usd_value"), numeric=True),
+            _fingerprint_value(get("size"), numeric=True),
+            _fingerprint_value(get("price"), numeric=True)
+        )
+    
+    def _create_notification_context(
+        self,
+        event: Dict[str, Any],
+        size_class: Optional[PositionSize] = None,
+        usd_value: Optional[float] = None
+    ) -> NotificationContext:
+        """
+        Create the notification context shared by all rules triggered by an event.
         
-        return "|".join(str(field) for field in key_fields if field is not None)
+        The context timestamp is the single clock read for the event; the
+        notification payloads reuse it instead of calling datetime.now() again.
+        """
+        return NotificationContext(
+            wallet=event.get("wallet", "unknown"),
+            event_type=event.get("type", "unknown"),
+            position_size=size_class,
+            usd_value=usd_value,
+            coin=event.get("coin"),
+            side=event.get("side"),
+            timestamp=datetime.now(timezone.utc),
+            additional_data=event
+        )
     
-    async def _create_notification(
+    def _create_notification(
         self, 
         event: Dict[str, Any], 
         rule: AlertRule,
-        position_analysis: Optional[Any] = None
-    ) -> Optional[Dict[str, Any]]:
+        context: NotificationContext,
+        formatted: Mapping[str, Any],
+        timestamp: str
+    ) -> Notification:
         """Create a notification for a triggered rule."""
-        try:
-            # Create notification context
-            context = NotificationContext(
-                wallet=event.get("wallet", "unknown"),
-                event_type=event.get("type", "unknown"),
-                position_size=position_analysis.size_class if position_analysis else None,
-                usd_value=position_analysis.usd_value if position_analysis else None,
-                coin=event.get("coin"),
-                side=event.get("side"),
-                timestamp=datetime.now(timezone.utc),
-                additional_data=event
-            )
-            
-            # Create notification payload
-            notification = {
-                "rule_name": rule.name,
-                "rule_severity": rule.severity.value,
-                "context": context,
-                "event": event,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
-            
-            # Add formatted content for different channels
-            notification["formatted"] = {
-                "discord": self.notification_formatter.format_discord_notification(context, event),
-                "telegram": self.notification_formatter.format_telegram_notification(context, event),
-                "email": self.notification_formatter.format_email_notification(context, event),
-                "webhook": self.notification_formatter.format_webhook_notification(context, event)
-            }
-            
-            return notification
-            
-        except Exception as e:
-            logger.error(f"Error creating notification for rule '{rule.name}': {e}")
-            return None
+        return Notification(
+            rule_name=rule.name,
+            rule_severity=rule.severity.value,
+            context=context,
+            event=event,
+            timestamp=timestamp,
+            formatted=formatted
+        )
     
-    async def send_notification(self, notification: Dict[str, Any]) -> bool:
+    async def send_notification(self, notification: Notification) -> bool:
         """
         Send a notification using the configured handler.
         
@@ -248,16 +408,16 @@ class AlertEngine:
         
         try:
             await self.notification_handler(notification)
-            logger.info(f"Notification sent for rule '{notification['rule_name']}'")
+            logger.info("Notification sent for rule '%s'", notification.rule_name)
             return True
             
         except Exception as e:
-            logger.error(f"Error sending notification: {e}")
+            logger.error("Error sending notification: %s", e)
             return False
     
     def get_stats(self) -> Dict[str, Any]:
         """Get alert engine statistics."""
-        uptime = datetime.now(timezone.utc) - self.stats["start_time"]
+        uptime_seconds = time.monotonic() - self._start_monotonic
         
         return {
             "engine_stats": {
@@ -265,8 +425,8 @@ class AlertEngine:
                 "alerts_triggered": self.stats["alerts_triggered"],
                 "notifications_sent": self.stats["notifications_sent"],
                 "errors": self.stats["errors"],
-                "uptime_seconds": uptime.total_seconds(),
-                "events_per_second": self.stats["events_processed"] / max(1, uptime.total_seconds())
+                "uptime_seconds": uptime_seconds,
+                "events_per_second": self.stats["events_processed"] / max(1, uptime_seconds)
             },
             "rules_stats": self.rules_engine.get_rule_stats(),
             "deduplication": {
@@ -288,28 +448,28 @@ class AlertEngine:
             "alerts_triggered": self.stats["alerts_triggered"],
             "notification_handler_configured": self.notification_handler is not None,
             "rules_count": len(self.rules_engine.rules),
-            "enabled_rules_count": len([r for r in self.rules_engine.rules if r.enabled])
+            "enabled_rules_count": sum(1 for r in self.rules_engine.rules if r.enabled)
         }
     
     def add_rule(self, rule: AlertRule):
         """Add a new rule to the engine."""
         self.rules_engine.add_rule(rule)
-        logger.info(f"Added rule: {rule.name}")
+        logger.info("Added rule: %s", rule.name)
     
     def remove_rule(self, rule_name: str):
         """Remove a rule from the engine."""
         self.rules_engine.remove_rule(rule_name)
-        logger.info(f"Removed rule: {rule_name}")
+        logger.info("Removed rule: %s", rule_name)
     
     def enable_rule(self, rule_name: str):
         """Enable a rule."""
         self.rules_engine.enable_rule(rule_name)
-        logger.info(f"Enabled rule: {rule_name}")
+        logger.info("Enabled rule: %s", rule_name)
     
     def disable_rule(self, rule_name: str):
         """Disable a rule."""
         self.rules_engine.disable_rule(rule_name)
-        logger.info(f"Disabled rule: {rule_name}")
+        logger.info("Disabled rule: %s", rule_name)
     
     def reset_stats(self):
         """Reset engine statistics."""
@@ -320,4 +480,5 @@ class AlertEngine:
             "errors": 0,
             "start_time": datetime.now(timezone.utc)
         }
+        self._start_monotonic = time.monotonic()
         logger.info("Alert engine stats reset")
@@ -5,15 +5,97 @@ This module provides rich formatting for notifications across different
 channels with emojis, formatting, and contextual information.
 """
 
-from typing import Dict, Any, Optional, List
+from collections.abc import Mapping
+from typing import Dict, Any, Optional, List, Callable, Iterator, Tuple
 from datetime import datetime, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .classifier import PositionSize
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Side values rendered with the long/up emoji, keyed by "is long"
+_LONG_SIDES = frozenset({"buy", "long"})
+_SIDE_EMOJI = {True: "📈", False: "📉"}
+
+# Static payload parts copied into every notification
+_DISCORD_IDENTITY = {
+    "username": "HyperLiquid Tracker",
+    "avatar_url": "https://hyperliquid.xyz/favicon.ico"
+}
+_WEBHOOK_METADATA = {
+    "source": "HyperLiquidWalletTracker",
+    "version": "2.0.0",
+    "monitoring_system": "hyperliquid"
+}
+
+# Email bodies are parsed once at import and filled with str.format_map per alert
+_EMAIL_HTML_TEMPLATE = """
+        <html>
+        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                        color: white; padding: 20px; border-radius: 8px 8px 0 0;">
+                <h1 style="margin: 0; font-size: 24px;">
+                    {emoji} {title}
+                </h1>
+            </div>
+            
+            <div style="background: #f8f9fa; padding: 20px; border-radius: 0 0 8px 8px;">
+                <p style="font-size: 16px; margin: 0 0 20px 0;">
+                    {description}
+                </p>
+                
+                <div style="background: white; padding: 15px; border-radius: 6px; margin: 10px 0;">
+                    <h3 style="margin: 0 0 10px 0; color: #333;">Position Details</h3>
+                    <table style="width: 100%; border-collapse: collapse;">
+                        <tr>
+                            <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">Value:</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #eee;">{value}</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">Coin:</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #eee;">{coin}</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">Side:</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #eee;">{side}</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">Wallet:</td>
+                            <td style="padding: 8px; border-bottom: 1px solid #eee;">{wallet}</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 8px; font-weight: bold;">Time:</td>
+                            <td style="padding: 8px;">{time}</td>
+                        </tr>
+                    </table>
+                </div>
+                
+                <div style="margin-top: 20px; padding: 15px; background: #e3f2fd; border-radius: 6px;">
+                    <p style="margin: 0; font-size: 14px; color: #1976d2;">
+                        <strong>HyperLiquidWalletTracker</strong> - Advanced wallet monitoring system
+                    </p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+_EMAIL_TEXT_TEMPLATE = """\
+{title}
+
+{description}
+
+Position Details:
+- Value: {value}
+- Coin: {coin}
+- Side: {side}
+- Wallet: {wallet}
+- Time: {time}
+
+HyperLiquidWalletTracker - Advanced wallet monitoring system"""
+
 
 @dataclass
 class NotificationContext:
@@ -26,6 +108,92 @@ class NotificationContext:
     side: Optional[str] = None
     timestamp: Optional[datetime] = None
     additional_data: Dict[str, Any] = None
+    
+    # Derived display values, computed once and shared by every channel
+    wallet_short: str = field(init=False, repr=False)
+    timestamp_iso: str = field(init=False, repr=False)
+    timestamp_human: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = datetime.now(timezone.utc)
+        
+        self.wallet_short = f"{(self.wallet or '')[:8]}..."
+        self.timestamp_iso = self.timestamp.isoformat()
+        self.timestamp_human = self.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+class FormattedNotification(Mapping):
+    """
+    Read-only mapping of channel name to formatted payload.
+    
+    Payloads are produced on first access and memoized, so channels that are
+    never dispatched to are never formatted.
+    """
+    
+    __slots__ = ("_formatters", "_context", "_event", "_cache")
+    
+    def __init__(
+        self,
+        formatters: Dict[str, Callable[[NotificationContext, Dict[str, Any]], Any]],
+        context: NotificationContext,
+        event: Dict[str, Any]
+    ):
+        """
+        Initialize lazily formatted notification.
+        
+        Args:
+            formatters: Channel name to formatter function
+            context: Notification context
+            event: Event data
+        """
+        self._formatters = formatters
+        self._context = context
+        self._event = event
+        self._cache: Dict[str, Any] = {}
+    
+    def __getitem__(self, channel: str) -> Any:
+        if channel in self._cache:
+            return self._cache[channel]
+        
+        payload = self._formatters[channel](self._context, self._event)
+        self._cache[channel] = payload
+        return payload
+    
+    def __contains__(self, channel: object) -> bool:
+        # Membership must not trigger formatting
+        return channel in self._formatters
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._formatters)
+    
+    def __len__(self) -> int:
+        return len(self._formatters)
+
+
+@dataclass
+class Notification:
+    """A notification generated for a triggered rule."""
+    
+    __slots__ = ("rule_name", "rule_severity", "context", "event", "timestamp", "formatted")
+    
+    rule_name: str
+    rule_severity: str
+    context: NotificationContext
+    event: Dict[str, Any]
+    timestamp: str
+    formatted: Mapping[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the notification as a plain dictionary."""
+        return {
+            "rule_name": self.rule_name,
+            "rule_severity": self.rule_severity,
+            "context": self.context,
+            "event": self.event,
+            "timestamp": self.timestamp,
+            "formatted": self.formatted
+        }
 
 
 class NotificationFormatter:
@@ -40,16 +208,18 @@ class NotificationFormatter:
     - Market context
     """
     
+    # Emoji, Discord embed color and webhook severity per position size
+    _SIZE_META: Dict[Optional[PositionSize], Tuple[str, int, str]] = {
+        PositionSize.WHALE: ("🐋", 0xff0000, "critical"),  # Red
+        PositionSize.LARGE: ("🦈", 0xff6600, "high"),  # Orange
+        PositionSize.MEDIUM: ("🐟", 0xffcc00, "medium"),  # Yellow
+        PositionSize.NOTABLE: ("🦐", 0x00ccff, "low"),  # Light blue
+        PositionSize.SMALL: ("🐠", 0x00ff00, "info")  # Green
+    }
+    _DEFAULT_SIZE_META = ("📊", 0x666666, "info")
+    
     def __init__(self):
         """Initialize notification formatter."""
-        self.emoji_map = {
-            PositionSize.WHALE: "🐋",
-            PositionSize.LARGE: "🦈", 
-            PositionSize.MEDIUM: "🐟",
-            PositionSize.NOTABLE: "🦐",
-            PositionSize.SMALL: "🐠"
-        }
-        
         self.severity_emojis = {
             "critical": "🚨",
             "high": "⚠️",
@@ -57,6 +227,30 @@ class NotificationFormatter:
             "low": "👀",
             "info": "ℹ️"
         }
+        
+        self.channel_formatters = {
+            "discord": self.format_discord_notification,
+            "telegram": self.format_telegram_notification,
+            "email": self.format_email_notification,
+            "webhook": self.format_webhook_notification
+        }
+    
+    def format_notification(
+        self, 
+        context: NotificationContext, 
+        event: Dict[str, Any]
+    ) -> FormattedNotification:
+        """
+        Format notification for all channels on demand.
+        
+        Args:
+            context: Notification context
+            event: Event data
+            
+        Returns:
+            Mapping of channel name to payload, formatted on first access
+        """
+        return FormattedNotification(self.channel_formatters, context, event)
     
     def format_discord_notification(
         self, 
@@ -73,15 +267,17 @@ class NotificationFormatter:
         Returns:
             Discord webhook payload
         """
+        prepared = self._prepare(context, event)
+        
         # Create embed
         embed = {
-            "title": self._get_title(context),
-            "description": self._get_description(context, event),
-            "color": self._get_color(context),
-            "timestamp": (context.timestamp or datetime.now(timezone.utc)).isoformat(),
-            "fields": self._get_discord_fields(context, event),
+            "title": prepared["title"],
+            "description": prepared["description"],
+            "color": prepared["color"],
+            "timestamp": context.timestamp_iso,
+            "fields": self._get_discord_fields(context, prepared),
             "footer": {
-                "text": f"HyperLiquidWalletTracker • {context.wallet[:8]}..."
+                "text": f"HyperLiquidWalletTracker • {context.wallet_short}"
             }
         }
         
@@ -91,11 +287,7 @@ class NotificationFormatter:
                 "url": f"https://cryptoicons.org/api/color/{context.coin.lower()}/200"
             }
         
-        return {
-            "username": "HyperLiquid Tracker",
-            "avatar_url": "https://hyperliquid.xyz/favicon.ico",
-            "embeds": [embed]
-        }
+        return {**_DISCORD_IDENTITY, "embeds": [embed]}
     
     def format_telegram_notification(
         self, 
@@ -112,35 +304,22 @@ class NotificationFormatter:
         Returns:
             Formatted Telegram message
         """
-        lines = []
-        
-        # Header with emoji
-        emoji = self.emoji_map.get(context.position_size, "📊")
-        lines.append(f"{emoji} *{self._get_title(context)}*")
-        lines.append("")
+        prepared = self._prepare(context, event)
         
-        # Main description
-        lines.append(self._get_description(context, event))
-        lines.append("")
+        side = context.side
+        side_line = ""
+        if side:
+            side_line = f"{_SIDE_EMOJI[side.lower() in _LONG_SIDES]} *Side:* {side.upper()}\n"
         
-        # Details
-        if context.usd_value:
-            lines.append(f"💰 *Value:* ${context.usd_value:,.2f}")
-        
-        if context.coin:
-            lines.append(f"🪙 *Coin:* {context.coin}")
-        
-        if context.side:
-            side_emoji = "📈" if context.side.lower() in ["buy", "long"] else "📉"
-            lines.append(f"{side_emoji} *Side:* {context.side.upper()}")
-        
-        lines.append(f"🔗 *Wallet:* `{context.wallet[:8]}...`")
-        
-        # Timestamp
-        timestamp = context.timestamp or datetime.now(timezone.utc)
-        lines.append(f"⏰ *Time:* {timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        
-        return "\n".join(lines)
+        return (
+            f"{prepared['emoji']} *{prepared['title']}*\n\n"
+            f"{prepared['description']}\n\n"
+            + (f"💰 *Value:* ${context.usd_value:,.2f}\n" if context.usd_value else "")
+            + (f"🪙 *Coin:* {context.coin}\n" if context.coin else "")
+            + side_line
+            + f"🔗 *Wallet:* `{context.wallet_short}`\n"
+            f"⏰ *Time:* {context.timestamp_human}"
+        )
     
     def format_email_notification(
         self, 
@@ -157,75 +336,22 @@ class NotificationFormatter:
         Returns:
             Email content (subject, html_body, text_body)
         """
-        subject = f"HyperLiquid Alert: {self._get_title(context)}"
+        prepared = self._prepare(context, event)
         
-        # HTML body
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                        color: white; padding: 20px; border-radius: 8px 8px 0 0;">
-                <h1 style="margin: 0; font-size: 24px;">
-                    {self.emoji_map.get(context.position_size, "📊")} {self._get_title(context)}
-                </h1>
-            </div>
-            
-            <div style="background: #f8f9fa; padding: 20px; border-radius: 0 0 8px 8px;">
-                <p style="font-size: 16px; margin: 0 0 20px 0;">
-                    {self._get_description(context, event)}
-                </p>
-                
-                <div style="background: white; padding: 15px; border-radius: 6px; margin: 10px 0;">
-                    <h3 style="margin: 0 0 10px 0; color: #333;">Position Details</h3>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr>
-                            <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">Value:</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #eee;">${context.usd_value:,.2f}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">Coin:</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #eee;">{context.coin or 'N/A'}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">Side:</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #eee;">{context.side or 'N/A'}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px; border-bottom: 1px solid #eee; font-weight: bold;">Wallet:</td>
-                            <td style="padding: 8px; border-bottom: 1px solid #eee;">{context.wallet[:8]}...</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px; font-weight: bold;">Time:</td>
-                            <td style="padding: 8px;">{(context.timestamp or datetime.now(timezone.utc)).strftime('%Y-%m-%d %H:%M:%S UTC')}</td>
-                        </tr>
-                    </table>
-                </div>
-                
-                <div style="margin-top: 20px; padding: 15px; background: #e3f2fd; border-radius: 6px;">
-                    <p style="margin: 0; font-size: 14px; color: #1976d2;">
-                        <strong>HyperLiquidWalletTracker</strong> - Advanced wallet monitoring system
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        fields = {
+            "emoji": prepared["emoji"],
+            "title": prepared["title"],
+            "description": prepared["description"],
+            "value": f"${context.usd_value:,.2f}" if context.usd_value is not None else "N/A",
+            "coin": context.coin or "N/A",
+            "side": context.side or "N/A",
+            "wallet": context.wallet_short,
+            "time": context.timestamp_human
+        }
         
-        # Text body
-        text_body = f"""
-{self._get_title(context)}
-
-{self._get_description(context, event)}
-
-Position Details:
-- Value: ${context.usd_value:,.2f}
-- Coin: {context.coin or 'N/A'}
-- Side: {context.side or 'N/A'}
-- Wallet: {context.wallet[:8]}...
-- Time: {(context.timestamp or datetime.now(timezone.utc)).strftime('%Y-%m-%d %H:%M:%S UTC')}
-
-HyperLiquidWalletTracker - Advanced wallet monitoring system
-        """.strip()
+        subject = f"HyperLiquid Alert: {prepared['title']}"
+        html_body = _EMAIL_HTML_TEMPLATE.format_map(fields)
+        text_body = _EMAIL_TEXT_TEMPLATE.format_map(fields)
         
         return {
             "subject": subject,
@@ -248,68 +374,68 @@ HyperLiquidWalletTracker - Advanced wallet monitoring system
         Returns:
             Webhook payload
         """
+        prepared = self._prepare(context, event)
+        
         return {
             "alert_type": "hyperliquid_wallet_activity",
-            "severity": self._get_severity(context),
-            "title": self._get_title(context),
-            "description": self._get_description(context, event),
-            "timestamp": (context.timestamp or datetime.now(timezone.utc)).isoformat(),
+            "severity": prepared["severity"],
+            "title": prepared["title"],
+            "description": prepared["description"],
+            "timestamp": context.timestamp_iso,
             "data": {
                 "wallet": context.wallet,
                 "event_type": context.event_type,
-                "position_size": context.position_size.value if context.position_size else None,
+                "position_size": prepared["size_value"],
                 "usd_value": context.usd_value,
                 "coin": context.coin,
                 "side": context.side,
                 "raw_event": event
             },
-            "metadata": {
-                "source": "HyperLiquidWalletTracker",
-                "version": "2.0.0",
-                "monitoring_system": "hyperliquid"
-            }
+            "metadata": dict(_WEBHOOK_METADATA)
         }
     
-    def _get_title(self, context: NotificationContext) -> str:
-        """Get notification title."""
-        if context.position_size:
-            emoji = self.emoji_map.get(context.position_size, "📊")
-            return f"{emoji} {context.position_size.value} Position Alert"
+    def _prepare(self, context: NotificationContext, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compute the values shared by every channel format in one pass.
+        
+        Args:
+            context: Notification context
+            event: Event data
+            
+        Returns:
+            Title, description, color, severity, emoji and size value
+        """
+        position_size = context.position_size
+        usd_value = context.usd_value
+        emoji, color, severity = self._SIZE_META.get(position_size, self._DEFAULT_SIZE_META)
+        size_value = position_size.value if position_size else None
+        
+        if position_size:
+            title = f"{emoji} {size_value} Position Alert"
         else:
-            return "📊 HyperLiquid Activity Alert"
-    
-    def _get_description(self, context: NotificationContext, event: Dict[str, Any]) -> str:
-        """Get notification description."""
-        if context.position_size and context.usd_value:
-            return f"Detected {context.position_size.value.lower()} position worth ${context.usd_value:,.2f}"
-        elif context.usd_value:
-            return f"Position detected worth ${context.usd_value:,.2f}"
+            title = "📊 HyperLiquid Activity Alert"
+        
+        if position_size and usd_value:
+            description = f"Detected {size_value.lower()} position worth ${usd_value:,.2f}"
+        elif usd_value:
+            description = f"Position detected worth ${usd_value:,.2f}"
         else:
-            return f"Activity detected on wallet {context.wallet[:8]}..."
-    
-    def _get_color(self, context: NotificationContext) -> int:
-        """Get Discord embed color based on position size."""
-        color_map = {
-            PositionSize.WHALE: 0xff0000,  # Red
-            PositionSize.LARGE: 0xff6600,  # Orange
-            PositionSize.MEDIUM: 0xffcc00,  # Yellow
-            PositionSize.NOTABLE: 0x00ccff,  # Light blue
-            PositionSize.SMALL: 0x00ff00   # Green
-        }
-        return color_map.get(context.position_size, 0x666666)
-    
-    def _get_severity(self, context: NotificationContext) -> str:
-        """Get severity level based on position size."""
-        severity_map = {
-            PositionSize.WHALE: "critical",
-            PositionSize.LARGE: "high",
-            PositionSize.MEDIUM: "medium",
-            PositionSize.NOTABLE: "low",
-            PositionSize.SMALL: "info"
+            description = f"Activity detected on wallet {context.wallet_short}"
+        
+        return {
+            "title": title,
+            "description": description,
+            "color": color,
+            "severity": severity,
+            "emoji": emoji,
+            "size_value": size_value
         }
-        return severity_map.get(context.position_size, "info")
     
-    def _get_discord_fields(self, context: NotificationContext, event: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _get_discord_fields(
+        self,
+        context: NotificationContext,
+        prepared: Dict[str, Any]
+    ) -> List[Dict[str, str]]:
         """Get Discord embed fields."""
         fields = []
         
@@ -327,24 +453,24 @@ HyperLiquidWalletTracker - Advanced wallet monitoring system
                 "inline": True
             })
         
-        if context.side:
-            side_emoji = "📈" if context.side.lower() in ["buy", "long"] else "📉"
+        side = context.side
+        if side:
             fields.append({
-                "name": f"{side_emoji} Side",
-                "value": context.side.upper(),
+                "name": f"{_SIDE_EMOJI[side.lower() in _LONG_SIDES]} Side",
+                "value": side.upper(),
                 "inline": True
             })
         
         fields.append({
             "name": "🔗 Wallet",
-            "value": f"`{context.wallet[:8]}...`",
+            "value": f"`{context.wallet_short}`",
             "inline": True
         })
         
         if context.position_size:
             fields.append({
                 "name": "📊 Classification",
-                "value": context.position_size.value,
+                "value": prepared["size_value"],
                 "inline": True
             })
         
@@ -5,7 +5,12 @@ This module defines alert rules, conditions, and the rules engine for
 processing events and determining when to trigger alerts.
 """
 
-from typing import Dict, Any, List, Optional, Callable
+import math
+import sys
+import time
+from bisect import bisect_right
+from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional, Callable, Deque, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
@@ -14,6 +19,17 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Candidate event field names, interned so dict probes hit the identity fast path
+_USD_FIELDS = tuple(sys.intern(f) for f in (
+    "usd_value", "usdValue", "value_usd", "valueUSD",
+    "total_value", "totalValue", "amount_usd", "amountUSD"
+))
+_PRICE_FIELDS = tuple(sys.intern(f) for f in ("price", "limitPx", "limit_px"))
+_SIZE_FIELDS = tuple(sys.intern(f) for f in ("size", "sz", "quantity"))
+
+# Event history entry: (timestamp, wallet, usd value)
+HistoryEntry = Tuple[float, Optional[str], float]
+
 
 class AlertCondition(Enum):
     """Alert condition types."""
@@ -102,6 +118,36 @@ DEFAULT_RULES = [
 ]
 
 
+def _count_reaches(entries: Deque[HistoryEntry], cutoff: float, threshold: float) -> bool:
+    """Check whether trailing entries stamped at or after the cutoff reach the threshold count."""
+    count = 0
+    for timestamp, _, _ in reversed(entries):
+        if timestamp < cutoff:
+            break
+        count += 1
+        if count >= threshold:
+            return True
+    
+    return count >= threshold
+
+
+def _sum_reaches(entries: Deque[HistoryEntry], cutoff: float, threshold: float) -> bool:
+    """Check whether trailing entries stamped at or after the cutoff reach the threshold volume."""
+    total = 0.0
+    for timestamp, _, usd_value in reversed(entries):
+        if timestamp < cutoff:
+            break
+        total += usd_value
+        if total >= threshold:
+            return True
+    
+    return total >= threshold
+
+
+# Condition evaluator: (rule, event, now timestamp) -> triggered
+RuleEvaluator = Callable[[AlertRule, Dict[str, Any], float], bool]
+
+
 class RulesEngine:
     """
     Rules engine for processing events and triggering alerts.
@@ -121,18 +167,41 @@ class RulesEngine:
             rules: List of alert rules (defaults to DEFAULT_RULES)
         """
         self.rules = rules or DEFAULT_RULES
-        self.rule_stats: Dict[str, Dict[str, Any]] = {}
-        self.event_history: List[Dict[str, Any]] = []
         self.max_history_size = 1000
         
-        # Initialize rule statistics
+        # Rule statistics stored as parallel lists indexed by a per-name slot,
+        # so trigger updates are plain list stores. Every enabled rule sees
+        # every event, so the event count is kept once for the engine.
+        self._total_events = 0
+        self._rule_slots: Dict[str, int] = {}
+        self._triggered_counts: List[int] = []
+        self._last_triggered_ts: List[Optional[float]] = []
         for rule in self.rules:
-            self.rule_stats[rule.name] = {
-                "triggered_count": 0,
-                "last_triggered": None,
-                "total_events": 0,
-                "success_rate": 0.0
-            }
+            self._reset_rule_stats(rule.name)
+        
+        # Condition dispatch table, all evaluators share one signature.
+        # Position size rules are matched against the sorted thresholds
+        # in _evaluate_at, so they have no entry here.
+        self._evaluators: Dict[AlertCondition, RuleEvaluator] = {
+            AlertCondition.VOLUME_THRESHOLD: self._evaluate_volume_threshold,
+            AlertCondition.PRICE_CHANGE: self._evaluate_price_change,
+            AlertCondition.FREQUENCY: self._evaluate_frequency,
+            AlertCondition.CUSTOM: self._evaluate_custom,
+        }
+        
+        # Event history in arrival order, indexed per wallet, with a running
+        # USD total so time-based rules only touch in-window entries
+        self.event_history: Deque[HistoryEntry] = deque()
+        self._history_by_wallet: Dict[str, Deque[HistoryEntry]] = defaultdict(deque)
+        self._history_volume = 0.0
+        
+        # Enabled rules split by how they are evaluated, in rule order
+        self._position_rules: List[AlertRule] = []
+        self._position_thresholds: List[float] = []
+        self._position_hits: List[List[AlertRule]] = [[]]
+        self._other_rules: List[AlertRule] = []
+        self._history_window = 0
+        self._refresh_rule_index()
     
     def evaluate_event(self, event: Dict[str, Any]) -> List[AlertRule]:
         """
@@ -144,89 +213,107 @@ class RulesEngine:
         Returns:
             List of triggered rules
         """
-        triggered_rules = []
+        return self._evaluate_at(event, time.time())
+    
+    def evaluate_events(self, events: List[Dict[str, Any]]) -> List[List[AlertRule]]:
+        """
+        Evaluate a batch of events against all rules.
         
-        # Add event to history
-        self._add_to_history(event)
+        The clock is read once for the whole batch. Time-based rules still see
+        the history grow event by event, so results match evaluating the
+        events one at a time in order.
         
-        for rule in self.rules:
-            if not rule.enabled:
-                continue
+        Args:
+            events: Events to evaluate, in arrival order
             
-            try:
-                if self._evaluate_rule(rule, event):
-                    triggered_rules.append(rule)
-                    self._update_rule_stats(rule, True)
-                    logger.info(f"Rule '{rule.name}' triggered for event")
-                else:
-                    self._update_rule_stats(rule, False)
-                    
-            except Exception as e:
-                logger.error(f"Error evaluating rule '{rule.name}': {e}")
-                self._update_rule_stats(rule, False, error=True)
-        
-        return triggered_rules
+        Returns:
+            Triggered rules per event
+        """
+        now_ts = time.time()
+        return [self._evaluate_at(event, now_ts) for event in events]
     
-    def _evaluate_rule(self, rule: AlertRule, event: Dict[str, Any]) -> bool:
-        """Evaluate a single rule against an event."""
-        if rule.condition == AlertCondition.POSITION_SIZE:
-            return self._evaluate_position_size(rule, event)
-        
-        elif rule.condition == AlertCondition.VOLUME_THRESHOLD:
-            return self._evaluate_volume_threshold(rule, event)
+    def _evaluate_at(self, event: Dict[str, Any], now_ts: float) -> List[AlertRule]:
+        """Evaluate an event against all rules at the given time."""
+        triggered_rules = []
+        self._total_events += 1
         
-        elif rule.condition == AlertCondition.PRICE_CHANGE:
-            return self._evaluate_price_change(rule, event)
+        # USD value is extracted once and shared by history and position rules
+        usd_value = self._extract_usd_value(event)
         
-        elif rule.condition == AlertCondition.FREQUENCY:
-            return self._evaluate_frequency(rule, event)
+        # Add event to history and drop entries no rule can look at anymore
+        self._add_to_history(event, now_ts, usd_value)
+        self._evict_expired(now_ts)
         
-        elif rule.condition == AlertCondition.CUSTOM:
-            return self._evaluate_custom(rule, event)
+        # Position size rules reached by this value, found with one binary
+        # search over the sorted thresholds instead of a compare per rule
+        if usd_value is None or math.isnan(usd_value):
+            matched = 0
+        else:
+            matched = bisect_right(self._position_thresholds, usd_value)
         
-        return False
-    
-    def _evaluate_position_size(self, rule: AlertRule, event: Dict[str, Any]) -> bool:
-        """Evaluate position size condition."""
-        if rule.threshold is None:
-            return False
+        for rule in self._position_hits[matched]:
+            self._record_trigger(rule, triggered_rules, now_ts)
         
-        # Extract USD value from event
-        usd_value = self._extract_usd_value(event)
-        if usd_value is None:
-            return False
+        for rule in self._other_rules:
+            try:
+                triggered = self._evaluate_rule(rule, event, now_ts)
+            except Exception as e:
+                logger.error("Error evaluating rule '%s': %s", rule.name, e)
+                continue
+            
+            if triggered:
+                self._record_trigger(rule, triggered_rules, now_ts)
         
-        return usd_value >= rule.threshold
+        return triggered_rules
+    
+    def _record_trigger(self, rule: AlertRule, triggered_rules: List[AlertRule], now_ts: float):
+        """Collect a triggered rule and update its statistics."""
+        triggered_rules.append(rule)
+        slot = self._rule_slots[rule.name]
+        self._triggered_counts[slot] += 1
+        self._last_triggered_ts[slot] = now_ts
+        logger.info("Rule '%s' triggered for event", rule.name)
+    
+    def _evaluate_rule(self, rule: AlertRule, event: Dict[str, Any], now_ts: float) -> bool:
+        """Evaluate a single rule against an event."""
+        evaluator = self._evaluators.get(rule.condition)
+        return evaluator(rule, event, now_ts) if evaluator else False
     
-    def _evaluate_volume_threshold(self, rule: AlertRule, event: Dict[str, Any]) -> bool:
+    def _evaluate_volume_threshold(
+        self,
+        rule: AlertRule,
+        event: Dict[str, Any],
+        now_ts: float
+    ) -> bool:
         """Evaluate volume threshold condition."""
         if rule.threshold is None or rule.time_window is None:
             return False
         
-        # Get events within time window
-        now = datetime.now(timezone.utc)
-        cutoff = now.timestamp() - rule.time_window
+        # History is already trimmed to the widest window, so the running
+        # total can be used as-is for rules spanning that window
+        if rule.time_window >= self._history_window:
+            return self._history_volume >= rule.threshold
         
-        recent_events = [
-            e for e in self.event_history
-            if e.get("timestamp", 0) >= cutoff
-        ]
-        
-        # Calculate total volume
-        total_volume = sum(
-            self._extract_usd_value(e) or 0
-            for e in recent_events
-        )
-        
-        return total_volume >= rule.threshold
+        # Sum events within the narrower time window, stopping once it is reached
+        return _sum_reaches(self.event_history, now_ts - rule.time_window, rule.threshold)
     
-    def _evaluate_price_change(self, rule: AlertRule, event: Dict[str, Any]) -> bool:
+    def _evaluate_price_change(
+        self,
+        rule: AlertRule,
+        event: Dict[str, Any],
+        now_ts: float
+    ) -> bool:
         """Evaluate price change condition."""
         # This would require historical price data
         # For now, return False as we don't have price history
         return False
     
-    def _evaluate_frequency(self, rule: AlertRule, event: Dict[str, Any]) -> bool:
+    def _evaluate_frequency(
+        self,
+        rule: AlertRule,
+        event: Dict[str, Any],
+        now_ts: float
+    ) -> bool:
         """Evaluate frequency condition."""
         if rule.threshold is None or rule.time_window is None:
             return False
@@ -236,18 +323,22 @@ class RulesEngine:
         if not wallet:
             return False
         
-        now = datetime.now(timezone.utc)
-        cutoff = now.timestamp() - rule.time_window
+        wallet_history = self._history_by_wallet.get(wallet)
+        if not wallet_history:
+            return False
         
-        recent_events = [
-            e for e in self.event_history
-            if (e.get("wallet") == wallet and 
-                e.get("timestamp", 0) >= cutoff)
-        ]
+        # Like volume rules, the widest window covers the whole trimmed history
+        if rule.time_window >= self._history_window:
+            return len(wallet_history) >= rule.threshold
         
-        return len(recent_events) >= rule.threshold
+        return _count_reaches(wallet_history, now_ts - rule.time_window, rule.threshold)
     
-    def _evaluate_custom(self, rule: AlertRule, event: Dict[str, Any]) -> bool:
+    def _evaluate_custom(
+        self,
+        rule: AlertRule,
+        event: Dict[str, Any],
+        now_ts: float
+    ) -> bool:
         """Evaluate custom condition."""
         if rule.custom_condition is None:
             return False
@@ -255,102 +346,206 @@ class RulesEngine:
         try:
             return rule.custom_condition(event)
         except Exception as e:
-            logger.error(f"Error in custom condition for rule '{rule.name}': {e}")
+            logger.error("Error in custom condition for rule '%s': %s", rule.name, e)
             return False
     
     def _extract_usd_value(self, event: Dict[str, Any]) -> Optional[float]:
         """Extract USD value from event data."""
         # Try different field names for USD value
-        usd_fields = [
-            "usd_value", "usdValue", "value_usd", "valueUSD",
-            "total_value", "totalValue", "amount_usd", "amountUSD"
-        ]
-        
-        for field in usd_fields:
-            if field in event and event[field] is not None:
+        for field in _USD_FIELDS:
+            value = event.get(field)
+            if value is not None:
                 try:
-                    return float(event[field])
+                    return float(value)
                 except (ValueError, TypeError):
                     continue
         
         # Try to calculate from price and size
-        price = event.get("price") or event.get("limitPx") or event.get("limit_px")
-        size = event.get("size") or event.get("sz") or event.get("quantity")
+        price = self._first_float(event, _PRICE_FIELDS)
+        size = self._first_float(event, _SIZE_FIELDS)
         
         if price is not None and size is not None:
-            try:
-                return float(price) * float(size)
-            except (ValueError, TypeError):
-                pass
+            return price * size
+        
+        return None
+    
+    def _first_float(self, event: Dict[str, Any], fields: Tuple[str, ...]) -> Optional[float]:
+        """Get the first of the given fields that converts to a float."""
+        for field in fields:
+            value = event.get(field)
+            if value is not None:
+                try:
+                    return float(value)
+                except (ValueError, TypeError):
+                    continue
         
         return None
     
-    def _add_to_history(self, event: Dict[str, Any]):
+    def _add_to_history(
+        self,
+        event: Dict[str, Any],
+        now_ts: float,
+        usd_value: Optional[float]
+    ):
         """Add event to history for time-based rules."""
         # Add timestamp if not present
         if "timestamp" not in event:
-            event["timestamp"] = datetime.now(timezone.utc).timestamp()
+            event["timestamp"] = now_ts
+        
+        # Windows are measured on arrival time, not the event's own timestamp:
+        # eviction pops from the left and relies on entries staying in order
+        timestamp = now_ts
         
-        self.event_history.append(event)
+        wallet = event.get("wallet")
+        if not isinstance(wallet, str):
+            wallet = None
+        # Only positive values count towards volume, which keeps window sums
+        # monotonic so scans can stop as soon as a threshold is reached
+        volume = usd_value if usd_value and usd_value > 0 else 0.0
+        entry = (timestamp, wallet, volume)
+        
+        self.event_history.append(entry)
+        self._history_volume += volume
+        if wallet:
+            self._history_by_wallet[wallet].append(entry)
         
         # Keep history size manageable
         if len(self.event_history) > self.max_history_size:
-            self.event_history = self.event_history[-self.max_history_size:]
+            self._pop_oldest_event()
+    
+    def _evict_expired(self, now_ts: float):
+        """Drop history entries older than the widest rule time window."""
+        if not self._history_window:
+            return
+        
+        cutoff = now_ts - self._history_window
+        history = self.event_history
+        while history and history[0][0] < cutoff:
+            self._pop_oldest_event()
+    
+    def _pop_oldest_event(self):
+        """Remove the oldest history entry from every index."""
+        _, wallet, usd_value = self.event_history.popleft()
+        
+        if self.event_history:
+            self._history_volume -= usd_value
+        else:
+            # Reset instead of subtracting so float error cannot accumulate
+            self._history_volume = 0.0
+        
+        if wallet:
+            wallet_history = self._history_by_wallet[wallet]
+            wallet_history.popleft()
+            if not wallet_history:
+                del self._history_by_wallet[wallet]
+    
+    def _refresh_rule_index(self):
+        """Rebuild the enabled rule buckets and the history window after rule changes."""
+        enabled_rules = [rule for rule in self.rules if rule.enabled]
+        self._position_rules = [
+            rule for rule in enabled_rules
+            if rule.condition == AlertCondition.POSITION_SIZE
+        ]
+        self._other_rules = [
+            rule for rule in enabled_rules
+            if rule.condition != AlertCondition.POSITION_SIZE
+        ]
+        
+        # For a USD value v, bisect_right(thresholds, v) indexes the position
+        # rules it reaches, kept in rule order
+        self._position_thresholds = sorted({
+            rule.threshold for rule in self._position_rules if rule.threshold is not None
+        })
+        bounds = [-math.inf] + self._position_thresholds
+        self._position_hits = [
+            [rule for rule in self._position_rules if self._reaches(rule, bound)]
+            for bound in bounds
+        ]
+        self._history_window = max((rule.time_window or 0 for rule in self.rules), default=0)
+    
+    @staticmethod
+    def _reaches(rule: AlertRule, usd_value: float) -> bool:
+        """Check whether a USD value reaches a position size rule's threshold."""
+        return rule.threshold is not None and usd_value >= rule.threshold
+    
+    def _reset_rule_stats(self, rule_name: str):
+        """Start statistics for a rule from zero, allocating a slot if needed."""
+        slot = self._rule_slots.get(rule_name)
+        if slot is None:
+            self._rule_slots[rule_name] = len(self._triggered_counts)
+            self._triggered_counts.append(0)
+            self._last_triggered_ts.append(None)
+        else:
+            self._triggered_counts[slot] = 0
+            self._last_triggered_ts[slot] = None
     
-    def _update_rule_stats(self, rule: AlertRule, triggered: bool, error: bool = False):
-        """Update rule statistics."""
-        stats = self.rule_stats[rule.name]
-        stats["total_events"] += 1
-        
-        if triggered:
-            stats["triggered_count"] += 1
-            stats["last_triggered"] = datetime.now(timezone.utc)
-        
-        # Calculate success rate
-        if stats["total_events"] > 0:
-            stats["success_rate"] = stats["triggered_count"] / stats["total_events"]
+    def _drop_rule_stats(self, rule_name: str):
+        """Release a rule's statistics slot and compact the slots after it."""
+        slot = self._rule_slots.pop(rule_name, None)
+        if slot is None:
+            return
+        
+        del self._triggered_counts[slot]
+        del self._last_triggered_ts[slot]
+        for name, other_slot in self._rule_slots.items():
+            if other_slot > slot:
+                self._rule_slots[name] = other_slot - 1
+    
+    @property
+    def rule_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics for all rules, keyed by rule name."""
+        return self.get_rule_stats()
     
     def get_rule_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all rules."""
-        return self.rule_stats.copy()
+        total_events = self._total_events
+        stats = {}
+        for rule_name, slot in self._rule_slots.items():
+            triggered_count = self._triggered_counts[slot]
+            last_triggered_ts = self._last_triggered_ts[slot]
+            stats[rule_name] = {
+                "triggered_count": triggered_count,
+                "last_triggered": (
+                    datetime.fromtimestamp(last_triggered_ts, timezone.utc)
+                    if last_triggered_ts is not None else None
+                ),
+                "total_events": total_events,
+                "success_rate": triggered_count / max(total_events, 1)
+            }
+        
+        return stats
     
     def get_triggered_rules(self, time_window: int = 3600) -> List[str]:
         """Get rules that have been triggered within the time window."""
-        now = datetime.now(timezone.utc)
-        cutoff = now.timestamp() - time_window
-        
-        triggered = []
-        for rule_name, stats in self.rule_stats.items():
-            if (stats["last_triggered"] and 
-                stats["last_triggered"].timestamp() >= cutoff):
-                triggered.append(rule_name)
+        cutoff = time.time() - time_window
+        last_triggered_ts = self._last_triggered_ts
         
-        return triggered
+        return [
+            rule_name for rule_name, slot in self._rule_slots.items()
+            if last_triggered_ts[slot] is not None and last_triggered_ts[slot] >= cutoff
+        ]
     
     def add_rule(self, rule: AlertRule):
         """Add a new rule to the engine."""
         self.rules.append(rule)
-        self.rule_stats[rule.name] = {
-            "triggered_count": 0,
-            "last_triggered": None,
-            "total_events": 0,
-            "success_rate": 0.0
-        }
-        logger.info(f"Added rule: {rule.name}")
+        self._reset_rule_stats(rule.name)
+        self._refresh_rule_index()
+        logger.info("Added rule: %s", rule.name)
     
     def remove_rule(self, rule_name: str):
         """Remove a rule from the engine."""
         self.rules = [r for r in self.rules if r.name != rule_name]
-        if rule_name in self.rule_stats:
-            del self.rule_stats[rule_name]
-        logger.info(f"Removed rule: {rule_name}")
+        self._drop_rule_stats(rule_name)
+        self._refresh_rule_index()
+        logger.info("Removed rule: %s", rule_name)
     
     def enable_rule(self, rule_name: str):
         """Enable a rule."""
         for rule in self.rules:
             if rule.name == rule_name:
                 rule.enabled = True
-                logger.info(f"Enabled rule: {rule_name}")
+                self._refresh_rule_index()
+                logger.info("Enabled rule: %s", rule_name)
                 break
     
     def disable_rule(self, rule_name: str):
@@ -358,5 +553,6 @@ class RulesEngine:
         for rule in self.rules:
             if rule.name == rule_name:
                 rule.enabled = False
-                logger.info(f"Disabled rule: {rule_name}")
+                self._refresh_rule_index()
+                logger.info("Disabled rule: %s", rule_name)
                 break
@@ -5,21 +5,53 @@ This module provides a modern CLI using Click for managing the
 HyperLiquidWalletTracker application.
 """
 
-import asyncio
-import json
+import copy
+import os
 import sys
+from collections import namedtuple
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import click
-from click import echo, secho, style
+from click import echo
 
-from .core.config import HyperLiquidConfig
-from .core.monitor import HyperLiquidWalletTracker
+from .utils.eventloop import run_async
 from .utils.logging import setup_logging, get_logger
+from .utils.serialization import json_dumps
+
+if TYPE_CHECKING:
+    from .core.config import HyperLiquidConfig
 
 logger = get_logger(__name__)
 
+# Rule printed around the status and start summaries
+_SEP = "=" * 60
+
+# ANSI sequences for the CLI's fixed colours, built once rather than by
+# click.style on every call. NO_COLOR (https://no-color.org) disables them;
+# echo still strips them when the output is not a terminal.
+if os.environ.get("NO_COLOR"):
+    _RED = _YELLOW = _GREEN = _CYAN_BOLD = _GREEN_BOLD = _RESET = ""
+else:
+    _RED = "\033[31m"
+    _YELLOW = "\033[33m"
+    _GREEN = "\033[32m"
+    _CYAN_BOLD = "\033[36m\033[1m"
+    _GREEN_BOLD = "\033[32m\033[1m"
+    _RESET = "\033[0m"
+
+
+def _secho(message: str, color: str):
+    """
+    Echo a message wrapped in one of the prebuilt colour sequences.
+    
+    Args:
+        message: Text to print
+        color: Colour sequence such as ``_RED``
+    """
+    echo(f"{color}{message}{_RESET}")
+
 
 @click.group()
 @click.version_option(version="2.0.0", prog_name="HyperLiquidWalletTracker")
@@ -52,19 +84,11 @@ def cli(ctx, config: Optional[Path], log_level: str, log_format: str):
     # Setup logging
     setup_logging(level=log_level, format_type=log_format)
     
-    # Load configuration
-    if config:
-        try:
-            config_obj = HyperLiquidConfig.load_from_yaml(config)
-        except Exception as e:
-            secho(f"Error loading configuration: {e}", fg="red")
-            sys.exit(1)
-    else:
-        config_obj = HyperLiquidConfig()
-    
-    # Store in context
+    # Store in context; the configuration itself is loaded by _get_config on
+    # first use, so commands that never read it skip the settings scan
     ctx.obj = {
-        "config": config_obj,
+        "config": None,
+        "config_path": config,
         "cli_options": {
             "log_level": log_level,
             "log_format": log_format
@@ -72,62 +96,116 @@ def cli(ctx, config: Optional[Path], log_level: str, log_format: str):
     }
 
 
+def _get_config(ctx) -> "HyperLiquidConfig":
+    """
+    Get the configuration for this invocation, loading it on first use.
+    
+    Args:
+        ctx: Click context populated by the ``cli`` group
+        
+    Returns:
+        Loaded HyperLiquidConfig instance
+    """
+    config_obj = ctx.obj["config"]
+    if config_obj is not None:
+        return config_obj
+    
+    from .core.config import HyperLiquidConfig
+    
+    config_path = ctx.obj["config_path"]
+    if config_path:
+        try:
+            config_obj = HyperLiquidConfig.load_from_yaml(config_path)
+        except Exception as e:
+            _secho(f"Error loading configuration: {e}", _RED)
+            sys.exit(1)
+    else:
+        config_obj = HyperLiquidConfig()
+    
+    ctx.obj["config"] = config_obj
+    return config_obj
+
+
+# Options accepted by the start command, in --help order
+_START_OPTIONS = [
+    click.option(
+        "--wallets",
+        "-w",
+        multiple=True,
+        help="Wallet addresses to monitor (can be specified multiple times)"
+    ),
+    click.option(
+        "--discord-webhook",
+        help="Discord webhook URL for notifications"
+    ),
+    click.option(
+        "--telegram-token",
+        help="Telegram bot token"
+    ),
+    click.option(
+        "--telegram-chat",
+        help="Telegram chat ID"
+    ),
+    click.option(
+        "--email-smtp",
+        help="SMTP server for email notifications"
+    ),
+    click.option(
+        "--email-from",
+        help="From email address"
+    ),
+    click.option(
+        "--email-to",
+        multiple=True,
+        help="To email addresses (can be specified multiple times)"
+    ),
+    click.option(
+        "--webhook-url",
+        help="Webhook URL for notifications"
+    ),
+    click.option(
+        "--whale-threshold",
+        type=float,
+        help="Whale position threshold in USD"
+    ),
+    click.option(
+        "--large-threshold", 
+        type=float,
+        help="Large position threshold in USD"
+    ),
+    click.option(
+        "--medium-threshold",
+        type=float,
+        help="Medium position threshold in USD"
+    ),
+    click.option(
+        "--notable-threshold",
+        type=float,
+        help="Notable position threshold in USD"
+    ),
+]
+
+
+def _with_options(options):
+    """
+    Build a decorator that attaches the given Click options to a command.
+    
+    Args:
+        options: Option decorators in the order they appear in ``--help``
+        
+    Returns:
+        Decorator applying every option to the wrapped function
+    """
+    def decorator(func):
+        # Click collects options bottom-up, so apply them in reverse
+        for option in reversed(options):
+            func = option(func)
+        return func
+    return decorator
+
+
 @cli.command()
-@click.option(
-    "--wallets",
-    "-w",
-    multiple=True,
-    help="Wallet addresses to monitor (can be specified multiple times)"
-)
-@click.option(
-    "--discord-webhook",
-    help="Discord webhook URL for notifications"
-)
-@click.option(
-    "--telegram-token",
-    help="Telegram bot token"
-)
-@click.option(
-    "--telegram-chat",
-    help="Telegram chat ID"
-)
-@click.option(
-    "--email-smtp",
-    help="SMTP server for email notifications"
-)
-@click.option(
-    "--email-from",
-    help="From email address"
-)
-@click.option(
-    "--email-to",
-    multiple=True,
-    help="To email addresses (can be specified multiple times)"
-)
-@click.option(
-    "--webhook-url",
-    help="Webhook URL for notifications"
-)
-@click.option(
-    "--whale-threshold",
-    type=float,
-    help="Whale position threshold in USD"
-)
-@click.option(
-    "--large-threshold", 
-    type=float,
-    help="Large position threshold in USD"
-)
-@click.option(
-    "--medium-threshold",
-    type=float,
-    help="Medium position threshold in USD"
-)
-@click.option(
-    "--notable-threshold",
-    type=float,
-    help="Notable position threshold in USD"
-)
+@_with_options(_START_OPTIONS)
 @click.pass_context
 def start(
     ctx,
@@ -145,7 +223,7 @@ def start(
     notable_threshold: Optional[float]
 ):
     """Start the HyperLiquidWalletTracker monitor."""
-    config = ctx.obj["config"]
+    config = _get_config(ctx)
     
     # Update configuration with CLI options
     if wallets:
@@ -180,44 +258,48 @@ def start(
     if notable_threshold:
         config.thresholds.notable_threshold = notable_threshold
     
+    config.invalidate_channels_cache()
+    
     # Validate configuration
     if not config.watched_wallets:
-        secho("Error: No wallets specified for monitoring", fg="red")
-        secho("Use --wallets option or configure in config file", fg="yellow")
+        _secho("Error: No wallets specified for monitoring", _RED)
+        _secho("Use --wallets option or configure in config file", _YELLOW)
         sys.exit(1)
     
-    # Display configuration
-    echo("\n" + "="*60)
-    secho("HyperLiquidWalletTracker Configuration", fg="cyan", bold=True)
-    echo("="*60)
-    echo(f"Wallets to monitor: {len(config.watched_wallets)}")
-    for wallet in config.watched_wallets:
-        echo(f"  • {wallet[:8]}...")
+    # Display configuration as one write rather than a line at a time
+    thresholds = config.thresholds
+    wallet_lines = "".join(f"  • {wallet[:8]}...\n" for wallet in config.watched_wallets)
+    echo(
+        f"\n{_SEP}\n"
+        f"{_CYAN_BOLD}HyperLiquidWalletTracker Configuration{_RESET}\n"
+        f"{_SEP}\n"
+        f"Wallets to monitor: {len(config.watched_wallets)}\n"
+        f"{wallet_lines}"
+        f"\nPosition thresholds:\n"
+        f"  • Whale: ${thresholds.whale_threshold:,.0f}\n"
+        f"  • Large: ${thresholds.large_threshold:,.0f}\n"
+        f"  • Medium: ${thresholds.medium_threshold:,.0f}\n"
+        f"  • Notable: ${thresholds.notable_threshold:,.0f}\n"
+        f"\nNotification channels:\n"
+        f"  • Discord: {'✓' if config.discord.enabled else '✗'}\n"
+        f"  • Telegram: {'✓' if config.telegram.enabled else '✗'}\n"
+        f"  • Email: {'✓' if config.email.enabled else '✗'}\n"
+        f"  • Webhook: {'✓' if config.webhook.enabled else '✗'}\n"
+        f"\n{_SEP}\n"
+        f"{_GREEN_BOLD}Starting monitor...{_RESET}\n"
+        f"{_SEP}"
+    )
     
-    echo(f"\nPosition thresholds:")
-    echo(f"  • Whale: ${config.thresholds.whale_threshold:,.0f}")
-    echo(f"  • Large: ${config.thresholds.large_threshold:,.0f}")
-    echo(f"  • Medium: ${config.thresholds.medium_threshold:,.0f}")
-    echo(f"  • Notable: ${config.thresholds.notable_threshold:,.0f}")
+    # Start the monitor; imported here so lighter commands skip its startup cost
+    from .core.monitor import HyperLiquidWalletTracker
     
-    echo(f"\nNotification channels:")
-    echo(f"  • Discord: {'✓' if config.discord.enabled else '✗'}")
-    echo(f"  • Telegram: {'✓' if config.telegram.enabled else '✗'}")
-    echo(f"  • Email: {'✓' if config.email.enabled else '✗'}")
-    echo(f"  • Webhook: {'✓' if config.webhook.enabled else '✗'}")
-    
-    echo("\n" + "="*60)
-    secho("Starting monitor...", fg="green", bold=True)
-    echo("="*60)
-    
-    # Start the monitor
     try:
         monitor = HyperLiquidWalletTracker(config)
-        asyncio.run(monitor.start())
+        run_async(monitor.run_forever())
     except KeyboardInterrupt:
-        secho("\nShutdown requested by user", fg="yellow")
+        _secho("\nShutdown requested by user", _YELLOW)
     except Exception as e:
-        secho(f"\nError starting monitor: {e}", fg="red")
+        _secho(f"\nError starting monitor: {e}", _RED)
         sys.exit(1)
 
 
@@ -231,11 +313,11 @@ def start(
 @click.pass_context
 def config(ctx, output: Optional[Path]):
     """Display current configuration."""
-    config = ctx.obj["config"]
+    config = _get_config(ctx)
     
     config_dict = {
         "watched_wallets": config.watched_wallets,
-        "websocket_url": str(config.websocket_url),
+        "websocket_url": config.websocket_url,
         "thresholds": {
             "whale_threshold": config.thresholds.whale_threshold,
             "large_threshold": config.thresholds.large_threshold,
@@ -245,7 +327,7 @@ def config(ctx, output: Optional[Path]):
         "notifications": {
             "discord": {
                 "enabled": config.discord.enabled,
-                "webhook_url": str(config.discord.webhook_url) if config.discord.webhook_url else None
+                "webhook_url": config.discord.webhook_url
             },
             "telegram": {
                 "enabled": config.telegram.enabled,
@@ -257,22 +339,23 @@ def config(ctx, output: Optional[Path]):
                 "smtp_server": config.email.smtp_server,
                 "smtp_port": config.email.smtp_port,
                 "username": config.email.username,
-                "from_addr": str(config.email.from_addr) if config.email.from_addr else None,
-                "to_addrs": [str(addr) for addr in config.email.to_addrs]
+                "from_addr": config.email.from_addr,
+                "to_addrs": config.email.to_addrs
             },
             "webhook": {
                 "enabled": config.webhook.enabled,
-                "url": str(config.webhook.url) if config.webhook.url else None,
+                "url": config.webhook.url,
                 "headers": config.webhook.headers
             }
         }
     }
     
-    config_json = json.dumps(config_dict, indent=2, default=str)
+    # default=str covers any value JSON cannot encode natively
+    config_json = json_dumps(config_dict, indent=True, default=str)
     
     if output:
-        output.write_text(config_json)
-        secho(f"Configuration saved to {output}", fg="green")
+        output.write_text(config_json, encoding="utf-8")
+        _secho(f"Configuration saved to {output}", _GREEN)
     else:
         echo(config_json)
 
@@ -281,32 +364,76 @@ def config(ctx, output: Optional[Path]):
 @click.pass_context
 def status(ctx):
     """Display system status and health."""
-    config = ctx.obj["config"]
-    
-    echo("\n" + "="*60)
-    secho("HyperLiquidWalletTracker Status", fg="cyan", bold=True)
-    echo("="*60)
-    
-    # Configuration status
-    echo("Configuration:")
-    echo(f"  • Wallets monitored: {len(config.watched_wallets)}")
-    echo(f"  • WebSocket URL: {config.websocket_url}")
-    
-    # Notification channels
-    echo("\nNotification Channels:")
-    echo(f"  • Discord: {'✓ Enabled' if config.discord.enabled else '✗ Disabled'}")
-    echo(f"  • Telegram: {'✓ Enabled' if config.telegram.enabled else '✗ Disabled'}")
-    echo(f"  • Email: {'✓ Enabled' if config.email.enabled else '✗ Disabled'}")
-    echo(f"  • Webhook: {'✓ Enabled' if config.webhook.enabled else '✗ Disabled'}")
+    config = _get_config(ctx)
+    thresholds = config.thresholds
     
-    # Thresholds
-    echo("\nPosition Thresholds:")
-    echo(f"  • Whale: ${config.thresholds.whale_threshold:,.0f}")
-    echo(f"  • Large: ${config.thresholds.large_threshold:,.0f}")
-    echo(f"  • Medium: ${config.thresholds.medium_threshold:,.0f}")
-    echo(f"  • Notable: ${config.thresholds.notable_threshold:,.0f}")
-    
-    echo("\n" + "="*60)
+    # Emit the whole report in one write rather than a line at a time
+    echo(
+        f"\n{_SEP}\n"
+        f"{_CYAN_BOLD}HyperLiquidWalletTracker Status{_RESET}\n"
+        f"{_SEP}\n"
+        # Configuration status
+        f"Configuration:\n"
+        f"  • Wallets monitored: {len(config.watched_wallets)}\n"
+        f"  • WebSocket URL: {config.websocket_url}\n"
+        # Notification channels
+        f"\nNotification Channels:\n"
+        f"  • Discord: {'✓ Enabled' if config.discord.enabled else '✗ Disabled'}\n"
+        f"  • Telegram: {'✓ Enabled' if config.telegram.enabled else '✗ Disabled'}\n"
+        f"  • Email: {'✓ Enabled' if config.email.enabled else '✗ Disabled'}\n"
+        f"  • Webhook: {'✓ Enabled' if config.webhook.enabled else '✗ Disabled'}\n"
+        # Thresholds
+        f"\nPosition Thresholds:\n"
+        f"  • Whale: ${thresholds.whale_threshold:,.0f}\n"
+        f"  • Large: ${thresholds.large_threshold:,.0f}\n"
+        f"  • Medium: ${thresholds.medium_threshold:,.0f}\n"
+        f"  • Notable: ${thresholds.notable_threshold:,.0f}\n"
+        f"\n{_SEP}"
+    )
+
+
+# Lightweight stand-in for NotificationContext used by test-notification
+_TestContext = namedtuple(
+    "Context",
+    "wallet event_type position_size usd_value coin side timestamp additional_data"
+)
+
+# Sample alert sent by test-notification; the wallet fields are filled in per run
+_TEST_NOTIFICATION_TEMPLATE = {
+    "event": {
+        "type": "test",
+        "wallet": None,
+        "coin": "BTC",
+        "side": "BUY",
+        "usd_value": 50000.0
+    },
+    "formatted": {
+        "discord": {
+            "username": "HyperLiquid Tracker",
+            "embeds": [{
+                "title": "🧪 Test Notification",
+                "description": "This is a test notification from HyperLiquidWalletTracker",
+                "color": 0x00ff00,
+                "fields": [
+                    {"name": "💰 Value", "value": "$50,000.00", "inline": True},
+                    {"name": "🪙 Coin", "value": "BTC", "inline": True},
+                    {"name": "🔗 Wallet", "value": None, "inline": True}
+                ]
+            }]
+        },
+        "telegram": "🧪 *Test Notification*\n\nThis is a test notification from HyperLiquidWalletTracker\n\n💰 *Value:* $50,000.00\n🪙 *Coin:* BTC\n🔗 *Wallet:* `test_wallet`",
+        "email": {
+            "subject": "HyperLiquid Alert: 🧪 Test Notification",
+            "html_body": "<html><body><h1>🧪 Test Notification</h1><p>This is a test notification from HyperLiquidWalletTracker</p></body></html>",
+            "text_body": "🧪 Test Notification\n\nThis is a test notification from HyperLiquidWalletTracker"
+        },
+        "webhook": {
+            "alert_type": "test",
+            "title": "🧪 Test Notification",
+            "description": "This is a test notification from HyperLiquidWalletTracker"
+        }
+    }
+}
 
 
 @cli.command()
@@ -325,56 +452,32 @@ def status(ctx):
 @click.pass_context
 def test_notification(ctx, wallet: str, channel: Optional[str]):
     """Test notification channels with a sample alert."""
-    config = ctx.obj["config"]
+    from .alerts.formatter import Notification
+    
+    config = _get_config(ctx)
     
     # Create test notification
-    test_notification = {
-        "rule_name": "test_notification",
-        "rule_severity": "info",
-        "context": type('Context', (), {
-            'wallet': wallet,
-            'event_type': 'test',
-            'position_size': None,
-            'usd_value': 50000.0,
-            'coin': 'BTC',
-            'side': 'BUY',
-            'timestamp': None,
-            'additional_data': {}
-        })(),
-        "event": {
-            "type": "test",
-            "wallet": wallet,
-            "coin": "BTC",
-            "side": "BUY",
-            "usd_value": 50000.0
-        },
-        "formatted": {
-            "discord": {
-                "username": "HyperLiquid Tracker",
-                "embeds": [{
-                    "title": "🧪 Test Notification",
-                    "description": "This is a test notification from HyperLiquidWalletTracker",
-                    "color": 0x00ff00,
-                    "fields": [
-                        {"name": "💰 Value", "value": "$50,000.00", "inline": True},
-                        {"name": "🪙 Coin", "value": "BTC", "inline": True},
-                        {"name": "🔗 Wallet", "value": f"`{wallet[:8]}...`", "inline": True}
-                    ]
-                }]
-            },
-            "telegram": "🧪 *Test Notification*\n\nThis is a test notification from HyperLiquidWalletTracker\n\n💰 *Value:* $50,000.00\n🪙 *Coin:* BTC\n🔗 *Wallet:* `test_wallet`",
-            "email": {
-                "subject": "HyperLiquid Alert: 🧪 Test Notification",
-                "html_body": "<html><body><h1>🧪 Test Notification</h1><p>This is a test notification from HyperLiquidWalletTracker</p></body></html>",
-                "text_body": "🧪 Test Notification\n\nThis is a test notification from HyperLiquidWalletTracker"
-            },
-            "webhook": {
-                "alert_type": "test",
-                "title": "🧪 Test Notification",
-                "description": "This is a test notification from HyperLiquidWalletTracker"
-            }
-        }
-    }
+    payload = copy.deepcopy(_TEST_NOTIFICATION_TEMPLATE)
+    payload["event"]["wallet"] = wallet
+    payload["formatted"]["discord"]["embeds"][0]["fields"][2]["value"] = f"`{wallet[:8]}...`"
+    
+    test_notification = Notification(
+        rule_name="test_notification",
+        rule_severity="info",
+        context=_TestContext(
+            wallet=wallet,
+            event_type="test",
+            position_size=None,
+            usd_value=50000.0,
+            coin="BTC",
+            side="BUY",
+            timestamp=None,
+            additional_data={}
+        ),
+        event=payload["event"],
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        formatted=payload["formatted"]
+    )
     
     async def test_channels():
         from .notifications.dispatcher import NotificationDispatcher
@@ -383,21 +486,21 @@ def test_notification(ctx, wallet: str, channel: Optional[str]):
         await dispatcher.start()
         
         try:
-            results = await dispatcher.dispatch_notification(test_notification)
+            results = await dispatcher.dispatch_notification(test_notification, parallel=True)
             
             echo("\nTest Results:")
             for result in results:
                 status = "✓ Success" if result.success else "✗ Failed"
-                color = "green" if result.success else "red"
-                secho(f"  • {result.channel}: {status}", fg=color)
+                color = _GREEN if result.success else _RED
+                _secho(f"  • {result.channel}: {status}", color)
                 if not result.success and result.error_message:
                     echo(f"    Error: {result.error_message}")
         
         finally:
             await dispatcher.stop()
     
-    secho("Testing notification channels...", fg="yellow")
-    asyncio.run(test_channels())
+    _secho("Testing notification channels...", _YELLOW)
+    run_async(test_channels())
 
 
 @cli.command()
@@ -458,18 +561,19 @@ def generate_config(output_format: str, output: Optional[Path]):
     }
     
     if output_format == "json":
-        content = json.dumps(sample_config, indent=2)
+        content = json_dumps(sample_config, indent=True)
     else:  # yaml
         try:
             import yaml
-            content = yaml.dump(sample_config, default_flow_style=False, indent=2)
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            content = yaml.dump(sample_config, Dumper=dumper, default_flow_style=False, indent=2)
         except ImportError:
-            secho("PyYAML not installed. Install with: pip install pyyaml", fg="red")
+            _secho("PyYAML not installed. Install with: pip install pyyaml", _RED)
             sys.exit(1)
     
     if output:
         output.write_text(content)
-        secho(f"Sample configuration saved to {output}", fg="green")
+        _secho(f"Sample configuration saved to {output}", _GREEN)
     else:
         echo(content)
 
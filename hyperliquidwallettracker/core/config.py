@@ -5,17 +5,89 @@ This module provides type-safe configuration management using Pydantic
 with environment variable support, validation, and hot-reloading capabilities.
 """
 
+import copy
+import functools
 import os
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import List, Optional, Dict, Any, FrozenSet, Tuple
+
+import yaml
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from pydantic_settings import BaseSettings
 
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+    logger.debug("libyaml not available, using the pure Python YAML loader")
+
+# Parsed YAML config files keyed by path, validated against (mtime, size)
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML mapping, reusing the parsed result while the file is unchanged.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Deep copy of the parsed mapping, safe for the caller to mutate
+    """
+    st = path.stat()
+    key = str(path)
+    
+    entry = _YAML_CACHE.get(key)
+    if entry is not None and entry[0] == st.st_mtime and entry[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(entry[2])
+    
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=SafeLoader) or {}
+    
+    if not isinstance(data, dict):
+        raise ValueError(f"Configuration file {path} must contain a mapping")
+    
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    
+    return copy.deepcopy(data)
+
+
+# Separators between wallet addresses in a comma-separated setting; runs of
+# commas and whitespace collapse into a single split
+_WALLET_SPLIT_RE = re.compile(r"[,\s]+")
+
+# Bumped whenever notification channel settings change, so cached
+# enabled-channel lists know when they are stale
+_channel_settings_version = 0
+
+
+def _bump_channel_settings_version():
+    """Invalidate every cached enabled-channel list."""
+    global _channel_settings_version
+    _channel_settings_version += 1
+
 
 class NotificationChannelConfig(BaseModel):
     """Configuration for a notification channel."""
     enabled: bool = True
     rate_limit_seconds: int = 30
+    
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        _bump_channel_settings_version()
 
 
 class DiscordConfig(NotificationChannelConfig):
@@ -64,10 +136,19 @@ class MonitoringConfig(BaseModel):
     metrics_port: int = 9090
     health_check_interval: int = 30
     log_level: str = "INFO"
+    # Include an ISO "timestamp" in status and health reports next to timestamp_ns
+    human_readable_timestamps: bool = True
     enable_redis: bool = False
     redis_url: str = "redis://localhost:6379"
 
 
+# HyperLiquidConfig fields holding notification channel configs, in the
+# order get_enabled_channels reports them; bit i of the enabled-channel mask
+# corresponds to _CHANNEL_NAMES[i]
+_CHANNEL_NAMES = ("discord", "telegram", "email", "webhook")
+_CHANNEL_FIELDS = frozenset(_CHANNEL_NAMES)
+
+
 class HyperLiquidConfig(BaseSettings):
     """Main configuration class for HyperLiquidWalletTracker."""
     
@@ -85,6 +166,10 @@ class HyperLiquidConfig(BaseSettings):
     # Watched wallets
     watched_wallets: List[str] = Field(default_factory=list)
     
+    # Event types (WebSocket channels such as "userFills") passed on to the
+    # alert engine; empty means every type
+    watched_event_types: List[str] = Field(default_factory=list)
+    
     # Position thresholds
     thresholds: PositionThresholds = Field(default_factory=PositionThresholds)
     
@@ -102,16 +187,21 @@ class HyperLiquidConfig(BaseSettings):
     coin_mappings_file: Path = Field(default=Path("coin_mappings.json"))
     cache_file: Path = Field(default=Path("rate_limiter_cache.json"))
     
+    # (channel settings version, enabled-channel bitmask) from the last lookup
+    _enabled_channels_cache: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+    # Lower-cased watched wallets, rebuilt after watched_wallets is reassigned
+    _watched_wallet_set: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+    
     class Config:
         env_prefix = "HYPERLIQUIDWALLETTRACKER_"
         env_file = ".env"
         case_sensitive = False
         
-    @validator('watched_wallets', pre=True)
+    @validator('watched_wallets', 'watched_event_types', pre=True)
     def parse_wallets(cls, v):
-        """Parse wallets from environment variable or config."""
+        """Parse wallets or event types from environment variable or config."""
         if isinstance(v, str):
-            return [wallet.strip() for wallet in v.split(',') if wallet.strip()]
+            return [item for item in _WALLET_SPLIT_RE.split(v) if item]
         return v
     
     @validator('debug')
@@ -119,18 +209,113 @@ class HyperLiquidConfig(BaseSettings):
         """Validate debug setting."""
         return bool(v)
     
+    @classmethod
+    def load_from_yaml(cls, path: Path) -> "HyperLiquidConfig":
+        """
+        Load configuration from a YAML file.
+        
+        Environment variables still apply to settings the file leaves out. A
+        ``notifications`` section, as written by ``generate-config``, is
+        flattened into the per-channel settings.
+        
+        Args:
+            path: Path to the YAML configuration file
+            
+        Returns:
+            Loaded HyperLiquidConfig instance
+        """
+        data = _load_yaml_cached(Path(path))
+        
+        notifications = data.pop("notifications", None) or {}
+        for channel, settings in notifications.items():
+            data.setdefault(channel, settings)
+        
+        return cls(**data)
+    
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in _CHANNEL_FIELDS:
+            # Replacing a whole channel config changes the enabled channels
+            _bump_channel_settings_version()
+        elif name == "watched_wallets":
+            self._watched_wallet_set = None
+    
     def get_enabled_channels(self) -> List[str]:
-        """Get list of enabled notification channels."""
-        channels = []
+        """
+        Get list of enabled notification channels.
+        
+        The underlying bitmask is cached until a channel setting is assigned.
+        In-place changes to container settings such as
+        ``email.to_addrs.append(...)`` are not tracked; call
+        ``invalidate_channels_cache`` after those.
+        """
+        mask = self._enabled_channels_mask()
+        if not mask:
+            return []
+        return [name for i, name in enumerate(_CHANNEL_NAMES) if mask >> i & 1]
+    
+    def _enabled_channels_mask(self) -> int:
+        """
+        Get a bitmask of enabled channels, indexed like ``_CHANNEL_NAMES``.
+        
+        Returns:
+            Integer with bit i set when ``_CHANNEL_NAMES[i]`` is enabled
+        """
+        cached = self._enabled_channels_cache
+        if cached is not None and cached[0] == _channel_settings_version:
+            return cached[1]
+        
+        mask = 0
         if self.discord.enabled and self.discord.webhook_url:
-            channels.append("discord")
+            mask |= 1
         if self.telegram.enabled and self.telegram.bot_token and self.telegram.chat_id:
-            channels.append("telegram")
+            mask |= 2
         if self.email.enabled and self.email.username and self.email.to_addrs:
-            channels.append("email")
+            mask |= 4
         if self.webhook.enabled and self.webhook.url:
-            channels.append("webhook")
-        return channels
+            mask |= 8
+        
+        self._enabled_channels_cache = (_channel_settings_version, mask)
+        return mask
+    
+    def _watched_wallet_lookup(self) -> FrozenSet[str]:
+        """Get the watched wallets as a lower-cased set, building it on first use."""
+        wallets = self._watched_wallet_set
+        if wallets is None:
+            wallets = frozenset(wallet.lower() for wallet in self.watched_wallets)
+            self._watched_wallet_set = wallets
+        return wallets
+    
+    def is_watched(self, address: Any) -> bool:
+        """
+        Check whether a wallet address is being monitored.
+        
+        Addresses are compared case-insensitively. The lookup set is rebuilt
+        when ``watched_wallets`` is assigned, not when the list is modified in
+        place.
+        
+        Args:
+            address: Wallet address to check
+            
+        Returns:
+            True if the address is in ``watched_wallets``; False for anything
+            that is not a string, such as a missing address
+        """
+        if not isinstance(address, str):
+            return False
+        return address.lower() in self._watched_wallet_lookup()
+    
+    def get_watched_wallet_count(self) -> int:
+        """Get the number of distinct watched wallets."""
+        return len(self._watched_wallet_lookup())
+    
+    def get_event_types(self) -> List[str]:
+        """Get the event types to process; an empty list means all of them."""
+        return self.watched_event_types
+    
+    def invalidate_channels_cache(self):
+        """Drop the cached enabled-channel lookup."""
+        self._enabled_channels_cache = None
     
     def validate_configuration(self) -> List[str]:
         """Validate configuration and return any issues."""
@@ -139,8 +324,7 @@ class HyperLiquidConfig(BaseSettings):
         if not self.watched_wallets:
             issues.append("No wallets configured for monitoring")
         
-        enabled_channels = self.get_enabled_channels()
-        if not enabled_channels:
+        if not self._enabled_channels_mask():
             issues.append("No notification channels configured")
         
         return issues
@@ -150,13 +334,26 @@ def load_config(config_path: Optional[Path] = None) -> HyperLiquidConfig:
     """
     Load configuration from file and environment variables.
     
+    Loaded settings are cached per path, so repeated calls do not re-read the
+    environment. Each call returns its own copy, so callers may modify it
+    freely. Call ``load_config.cache_clear()`` to force a reload.
+    
     Args:
         config_path: Optional path to configuration file
         
     Returns:
         Loaded HyperLiquidConfig instance
     """
-    if config_path and config_path.exists():
+    cached = _load_config_cached(str(config_path) if config_path else None)
+    return cached.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: Optional[str]) -> HyperLiquidConfig:
+    """Build a configuration for ``load_config``; keyed by the path string."""
+    # A single stat on the path string; pydantic-settings re-opens the env
+    # file by path, so there is no handle to share with it
+    if config_path and os.path.isfile(config_path):
         # Load from specific file
         return HyperLiquidConfig(_env_file=config_path)
     else:
@@ -164,5 +361,8 @@ def load_config(config_path: Optional[Path] = None) -> HyperLiquidConfig:
         return HyperLiquidConfig()
 
 
+load_config.cache_clear = _load_config_cached.cache_clear
+
+
 # Global configuration instance
 config = load_config()
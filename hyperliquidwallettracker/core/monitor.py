@@ -6,19 +6,45 @@ system with comprehensive event processing, alerting, and notification capabilit
 """
 
 import asyncio
+import logging
 import signal
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 from .config import HyperLiquidConfig
 from .websocket_client import WebSocketClient
 from ..alerts.engine import AlertEngine
 from ..notifications.dispatcher import NotificationDispatcher
+from ..utils.eventloop import run_async
 from ..utils.logging import get_logger, setup_logging, LoggerMixin
 from ..utils.metrics import metrics_collector
+from ..utils.serialization import json_dumps_bytes
 
 logger = get_logger(__name__)
 
+# Events counted locally before being folded into the shared metrics collector
+_METRICS_FLUSH_EVERY = 128
+
+_UTC = timezone.utc
+
+# Seconds between refreshes of the metrics summary embedded in get_status
+_METRICS_SNAPSHOT_INTERVAL = 1.0
+
+# Events buffered between the WebSocket client and the alert engine, and the
+# most handed to the engine in one batch
+_EVENT_QUEUE_MAXSIZE = 10_000
+_EVENT_BATCH_SIZE = 64
+
+# (config field, credentials check) for each notification channel, in the
+# order get_configuration reports them
+_CHANNEL_PROBES = (
+    ("discord", lambda c: c.webhook_url),
+    ("telegram", lambda c: c.bot_token and c.chat_id),
+    ("email", lambda c: c.username and c.to_addrs),
+    ("webhook", lambda c: c.url),
+)
+
 
 class HyperLiquidWalletTracker(LoggerMixin):
     """
@@ -37,6 +63,28 @@ class HyperLiquidWalletTracker(LoggerMixin):
     - Configuration validation
     """
     
+    # Fixed attribute layout; the logger comes from LoggerMixin's property
+    __slots__ = (
+        "config",
+        "is_running",
+        "websocket_client",
+        "alert_engine",
+        "notification_dispatcher",
+        "_ws_task",
+        "_stop_task",
+        "_unflushed_events",
+        "_event_types_of_interest",
+        "_filtered_events",
+        "_ts_cache",
+        "_config_snapshot",
+        "_event_queue",
+        "_consumer_task",
+        "_metrics_snapshot",
+        "_metrics_snapshot_task",
+        "_status_bytes",
+        "_signal_handlers",
+    )
+    
     def __init__(self, config: Optional[HyperLiquidConfig] = None):
         """
         Initialize HyperLiquidWalletTracker monitor.
@@ -46,7 +94,31 @@ class HyperLiquidWalletTracker(LoggerMixin):
         """
         self.config = config or HyperLiquidConfig()
         self.is_running = False
-        self.shutdown_event = asyncio.Event()
+        # Task running the WebSocket client; cancelling it shuts the system down
+        self._ws_task: Optional[asyncio.Task] = None
+        self._stop_task: Optional[asyncio.Future] = None
+        # (signal, previous handler) for each handler installed by start(); the
+        # previous handler is None when the event loop installed it
+        self._signal_handlers: List[Tuple[int, Any]] = []
+        self._unflushed_events = 0
+        
+        # Event types worth processing (empty means all) and how many were skipped
+        self._event_types_of_interest = frozenset(self.config.get_event_types())
+        self._filtered_events = 0
+        
+        # (epoch seconds, ISO string) reused by status and health reports
+        self._ts_cache = (0.0, "")
+        self._config_snapshot: Optional[Dict[str, Any]] = None
+        
+        # Events flow from the WebSocket client through this queue to the consumer
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
+        
+        # Metrics summary refreshed in the background while running
+        self._metrics_snapshot: Optional[Dict[str, Any]] = None
+        self._metrics_snapshot_task: Optional[asyncio.Task] = None
+        # get_status serialized to JSON alongside each metrics refresh
+        self._status_bytes: Optional[bytes] = None
         
         # Initialize components
         self.websocket_client: Optional[WebSocketClient] = None
@@ -69,7 +141,7 @@ class HyperLiquidWalletTracker(LoggerMixin):
         if issues:
             self.logger.warning("Configuration issues detected:")
             for issue in issues:
-                self.logger.warning(f"  - {issue}")
+                self.logger.warning("  - %s", issue)
         else:
             self.logger.info("Configuration validation passed")
     
@@ -77,7 +149,8 @@ class HyperLiquidWalletTracker(LoggerMixin):
         """
         Start the CryptoPulse monitoring system.
         
-        This method initializes all components and begins monitoring.
+        This method initializes all components and begins monitoring in a
+        background task, then returns; ``run_forever`` waits for it to finish.
         """
         if self.is_running:
             self.logger.warning("Monitor is already running")
@@ -97,6 +170,11 @@ class HyperLiquidWalletTracker(LoggerMixin):
             )
             await self.alert_engine.start()
             
+            # Start the consumer feeding queued events to the alert engine
+            self._event_queue = asyncio.Queue(maxsize=_EVENT_QUEUE_MAXSIZE)
+            self._consumer_task = asyncio.create_task(self._consume_events())
+            self._metrics_snapshot_task = asyncio.create_task(self._refresh_metrics_loop())
+            
             # Initialize WebSocket client
             self.websocket_client = WebSocketClient(
                 config=self.config,
@@ -108,36 +186,60 @@ class HyperLiquidWalletTracker(LoggerMixin):
             
             # Start monitoring
             self.is_running = True
+            self._ws_task = asyncio.create_task(self.websocket_client.run())
             self.logger.info("HyperLiquidWalletTracker monitoring system started successfully")
             
-            # Start WebSocket client
-            await self.websocket_client.run()
-            
         except Exception as e:
             self.logger.error(f"Failed to start monitoring system: {e}")
-            await self.stop()
+            # is_running is still False, so stop() would return early; tear
+            # down whatever was started before the failure directly
+            await self._stop_components()
             raise
     
     async def stop(self):
-        """Stop the CryptoPulse monitoring system gracefully."""
-        if not self.is_running:
-            return
+        """
+        Stop the CryptoPulse monitoring system gracefully.
         
+        Concurrent calls wait for the same shutdown to finish.
+        """
+        if self._stop_task is None:
+            if not self.is_running:
+                return
+            self._stop_task = asyncio.ensure_future(self._stop_components())
+        
+        stop_task = self._stop_task
+        try:
+            await asyncio.shield(stop_task)
+        finally:
+            if stop_task.done() and self._stop_task is stop_task:
+                self._stop_task = None
+    
+    async def _stop_components(self):
+        """Tear down all components; run once per shutdown by ``stop``."""
         self.logger.info("Stopping HyperLiquidWalletTracker monitoring system...")
         self.is_running = False
+        self._remove_signal_handlers()
         
-        # Stop components in reverse order
-        if self.websocket_client:
-            await self.websocket_client.shutdown()
+        self._flush_event_metrics()
         
-        if self.alert_engine:
-            await self.alert_engine.stop()
+        # Cancel the WebSocket task first so no new events arrive
+        await self._cancel_task(self._ws_task)
         
-        if self.notification_dispatcher:
-            await self.notification_dispatcher.stop()
+        # Closing the socket, stopping the metrics refresher and draining the
+        # event pipeline are independent, so overlap them; failures are logged
+        # individually instead of aborting the rest of the shutdown
+        teardown = [self._cancel_task(self._metrics_snapshot_task), self._stop_pipeline()]
+        if self.websocket_client:
+            teardown.append(self.websocket_client.shutdown())
+        
+        for result in await asyncio.gather(*teardown, return_exceptions=True):
+            # BaseException so a step that ended in CancelledError is reported too
+            if isinstance(result, BaseException):
+                self.logger.error("Error during shutdown: %r", result)
         
-        # Set shutdown event
-        self.shutdown_event.set()
+        self._metrics_snapshot_task = None
+        self._metrics_snapshot = None
+        self._status_bytes = None
         
         self.logger.info("HyperLiquidWalletTracker monitoring system stopped")
     
@@ -145,32 +247,170 @@ class HyperLiquidWalletTracker(LoggerMixin):
         """
         Handle incoming events from WebSocket client.
         
+        Events are queued for the consumer task so the client can go straight
+        back to reading frames.
+        
         Args:
             event: Event data to process
         """
+        # Drop event types nobody watches before doing any other work
+        event_types = self._event_types_of_interest
+        if event_types and event.get("type") not in event_types:
+            self._filtered_events += 1
+            return
+        
+        queue = self._event_queue
         try:
-            # Update metrics
-            metrics_collector.update_system_metrics(
-                total_events_processed=metrics_collector.system_metrics.total_events_processed + 1
-            )
+            # Update metrics in batches rather than on every event
+            unflushed = self._unflushed_events + 1
+            self._unflushed_events = unflushed
+            if unflushed >= _METRICS_FLUSH_EVERY:
+                self._flush_event_metrics()
+            
+            # The queue only exists between start() and stop()
+            if queue is None:
+                return
+            
+            if queue.full():
+                # Drop the oldest event so the freshest activity is kept
+                queue.get_nowait()
+                self.logger.warning("Event queue full, dropped oldest event")
+            queue.put_nowait(event)
             
-            # Process through alert engine
+        except Exception as e:
+            self.logger.error("Error handling event: %s", e)
+    
+    async def _consume_events(self):
+        """Feed queued events to the alert engine in batches."""
+        queue = self._event_queue
+        
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _EVENT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            await self._process_batch(batch)
+    
+    async def _process_batch(self, batch: List[Dict[str, Any]]):
+        """
+        Process a batch of events through the alert engine.
+        
+        Args:
+            batch: Events in arrival order
+        """
+        try:
             if self.alert_engine:
-                await self.alert_engine.process_event(event)
+                await self.alert_engine.process_events(batch)
             
-            self.logger.debug(f"Processed event: {event.get('type', 'unknown')}")
+            # Skip building the log call entirely unless DEBUG is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Processed events", count=len(batch))
             
         except Exception as e:
-            self.logger.error(f"Error handling event: {e}")
+            self.logger.error("Error processing events: %s", e)
+    
+    @staticmethod
+    async def _cancel_task(task: Optional[asyncio.Task]):
+        """Cancel a background task, if still running, and wait for it to finish."""
+        if task is None or task.done():
+            return
+        
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    
+    async def _stop_pipeline(self):
+        """
+        Stop the event pipeline in data-flow order.
+        
+        Queued events are drained into the alert engine before it stops, and
+        the notification dispatcher stops last so it can take the engine's
+        final notifications.
+        """
+        await self._stop_consumer()
+        
+        if self.alert_engine:
+            await self.alert_engine.stop()
+        
+        if self.notification_dispatcher:
+            await self.notification_dispatcher.stop()
+    
+    async def _stop_consumer(self):
+        """Stop the event consumer, processing anything still queued."""
+        await self._cancel_task(self._consumer_task)
+        self._consumer_task = None
+        
+        queue = self._event_queue
+        while queue and not queue.empty():
+            batch = []
+            while len(batch) < _EVENT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            await self._process_batch(batch)
+    
+    def _flush_event_metrics(self):
+        """Fold locally counted events into the metrics collector."""
+        if self._unflushed_events:
+            metrics_collector.add_events_processed(self._unflushed_events)
+            self._unflushed_events = 0
+    
+    async def _refresh_metrics_loop(self):
+        """Periodically refresh the metrics summary and serialized status."""
+        while True:
+            self._flush_event_metrics()
+            self._metrics_snapshot = metrics_collector.get_metrics_summary()
+            try:
+                self._status_bytes = await self._serialize_status()
+            except Exception as e:
+                self.logger.debug("Could not serialize status: %s", e)
+            await asyncio.sleep(_METRICS_SNAPSHOT_INTERVAL)
     
     def _setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, initiating shutdown...")
-            asyncio.create_task(self.stop())
+        loop = asyncio.get_running_loop()
+        
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                # Runs on the loop itself, so it can cancel the WebSocket task directly
+                loop.add_signal_handler(sig, self._request_shutdown, sig)
+                self._signal_handlers.append((sig, None))
+            except NotImplementedError:
+                # Windows event loops have no add_signal_handler
+                previous = signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(self._request_shutdown, signum)
+                )
+                self._signal_handlers.append((sig, previous))
+    
+    def _remove_signal_handlers(self):
+        """Undo ``_setup_signal_handlers``, restoring any replaced handlers."""
+        loop = asyncio.get_running_loop()
+        
+        for sig, previous in self._signal_handlers:
+            if previous is None:
+                loop.remove_signal_handler(sig)
+            else:
+                signal.signal(sig, previous)
+        self._signal_handlers = []
+    
+    def _request_shutdown(self, signum: int):
+        """Begin a shutdown requested by a signal."""
+        self.logger.info("Received signal %s, initiating shutdown...", signum)
+        if self._ws_task:
+            self._ws_task.cancel()
+    
+    def _cached_iso_now(self) -> str:
+        """
+        Get the current UTC time as an ISO string, refreshed at most once a second.
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        Returns:
+            ISO 8601 timestamp, at most one second old
+        """
+        now = time.time()
+        if now - self._ts_cache[0] >= 1.0:
+            self._ts_cache = (now, datetime.fromtimestamp(now, _UTC).isoformat())
+        return self._ts_cache[1]
     
     async def get_status(self) -> Dict[str, Any]:
         """
@@ -181,13 +421,16 @@ class HyperLiquidWalletTracker(LoggerMixin):
         """
         status = {
             "is_running": self.is_running,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp_ns": time.time_ns(),
+            "filtered_events": self._filtered_events,
             "config": {
-                "watched_wallets": len(self.config.watched_wallets),
+                "watched_wallets": self.config.get_watched_wallet_count(),
                 "enabled_channels": self.config.get_enabled_channels(),
                 "log_level": self.config.monitoring.log_level
             }
         }
+        if self.config.monitoring.human_readable_timestamps:
+            status["timestamp"] = self._cached_iso_now()
         
         # Add component status
         if self.websocket_client:
@@ -205,11 +448,35 @@ class HyperLiquidWalletTracker(LoggerMixin):
             status["notification_dispatcher"] = self.notification_dispatcher.get_stats()
             status["notification_channels"] = self.notification_dispatcher.get_channel_stats()
         
-        # Add metrics
-        status["metrics"] = metrics_collector.get_metrics_summary()
+        # Add metrics, from the background snapshot while running
+        snapshot = self._metrics_snapshot
+        if snapshot is None:
+            self._flush_event_metrics()
+            snapshot = metrics_collector.get_metrics_summary()
+        status["metrics"] = snapshot
         
         return status
     
+    async def get_status_bytes(self) -> bytes:
+        """
+        Get current system status as a JSON document.
+        
+        While running, this returns the copy serialized by the background
+        metrics refresh, so it may be up to a second old; probes can write it
+        out without re-encoding the status on every request.
+        
+        Returns:
+            ``get_status`` encoded as UTF-8 JSON bytes
+        """
+        status_bytes = self._status_bytes
+        if status_bytes is None:
+            status_bytes = await self._serialize_status()
+        return status_bytes
+    
+    async def _serialize_status(self) -> bytes:
+        """Encode the current ``get_status`` result as JSON."""
+        return json_dumps_bytes(await self.get_status(), default=str)
+    
     async def get_health(self) -> Dict[str, Any]:
         """
         Get system health status.
@@ -217,52 +484,54 @@ class HyperLiquidWalletTracker(LoggerMixin):
         Returns:
             Dictionary containing health information
         """
-        health = {
-            "status": "healthy" if self.is_running else "stopped",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "components": {}
-        }
+        components = {}
         
         # Check WebSocket health
+        websocket_healthy = False
         if self.websocket_client:
-            websocket_healthy = (
-                self.websocket_client.stats.connected and
-                self.websocket_client.stats.consecutive_failures < 5
-            )
-            health["components"]["websocket"] = {
+            stats = self.websocket_client.stats
+            websocket_healthy = stats.connected and stats.consecutive_failures < 5
+            components["websocket"] = {
                 "status": "healthy" if websocket_healthy else "unhealthy",
-                "connected": self.websocket_client.stats.connected,
-                "consecutive_failures": self.websocket_client.stats.consecutive_failures
+                "connected": stats.connected,
+                "consecutive_failures": stats.consecutive_failures
             }
         else:
-            health["components"]["websocket"] = {"status": "not_initialized"}
+            components["websocket"] = {"status": "not_initialized"}
         
         # Check alert engine health
+        alert_engine_healthy = False
         if self.alert_engine:
             alert_engine_healthy = self.alert_engine.is_running
-            health["components"]["alert_engine"] = {
+            components["alert_engine"] = {
                 "status": "healthy" if alert_engine_healthy else "unhealthy",
                 "is_running": alert_engine_healthy
             }
         else:
-            health["components"]["alert_engine"] = {"status": "not_initialized"}
+            components["alert_engine"] = {"status": "not_initialized"}
         
         # Check notification dispatcher health
+        dispatcher_healthy = False
         if self.notification_dispatcher:
             dispatcher_healthy = self.notification_dispatcher.is_running
-            health["components"]["notification_dispatcher"] = {
+            components["notification_dispatcher"] = {
                 "status": "healthy" if dispatcher_healthy else "unhealthy",
                 "is_running": dispatcher_healthy
             }
         else:
-            health["components"]["notification_dispatcher"] = {"status": "not_initialized"}
+            components["notification_dispatcher"] = {"status": "not_initialized"}
         
-        # Overall health
-        all_healthy = all(
-            comp.get("status") == "healthy" 
-            for comp in health["components"].values()
-        )
-        health["overall_status"] = "healthy" if all_healthy else "degraded"
+        # Overall health, straight from the flags rather than re-reading statuses
+        all_healthy = websocket_healthy and alert_engine_healthy and dispatcher_healthy
+        
+        health = {
+            "status": "healthy" if self.is_running else "stopped",
+            "timestamp_ns": time.time_ns(),
+            "components": components,
+            "overall_status": "healthy" if all_healthy else "degraded"
+        }
+        if self.config.monitoring.human_readable_timestamps:
+            health["timestamp"] = self._cached_iso_now()
         
         return health
     
@@ -270,28 +539,59 @@ class HyperLiquidWalletTracker(LoggerMixin):
         """
         Run the monitoring system indefinitely.
         
-        This method starts the system and runs until stopped.
+        This method starts the system and runs until stopped, either by
+        ``stop()`` or by a shutdown signal cancelling the WebSocket task.
+        Unexpected errors are logged and re-raised once the system has stopped.
         """
         try:
             await self.start()
             
-            # Wait for shutdown signal
-            await self.shutdown_event.wait()
+            # Wait without awaiting the task itself, so cancelling it (a
+            # shutdown request) ends the wait normally while cancelling this
+            # coroutine still propagates to the caller
+            ws_task = self._ws_task
+            await asyncio.wait((ws_task,))
+            if not ws_task.cancelled():
+                ws_task.result()
             
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt, shutting down...")
         except Exception as e:
             self.logger.error(f"Unexpected error in main loop: {e}")
+            raise
         finally:
             await self.stop()
     
+    def run(self):
+        """
+        Run the monitoring system from synchronous code until it stops.
+        
+        The event loop is uvloop's when it is installed, which speeds up the
+        socket handling behind every WebSocket message.
+        """
+        run_async(self.run_forever())
+    
     def get_configuration(self) -> Dict[str, Any]:
         """
         Get current configuration.
         
+        The snapshot is built on first use and shared between calls; call
+        ``invalidate_configuration_cache`` after changing the configuration.
+        Callers must not modify the returned dictionary.
+        
         Returns:
             Dictionary containing configuration information
         """
+        if self._config_snapshot is None:
+            self._config_snapshot = self._build_configuration_snapshot()
+        return self._config_snapshot
+    
+    def invalidate_configuration_cache(self):
+        """Rebuild the ``get_configuration`` snapshot on its next call."""
+        self._config_snapshot = None
+    
+    def _build_configuration_snapshot(self) -> Dict[str, Any]:
+        """Build the dictionary returned by ``get_configuration``."""
         return {
             "watched_wallets": self.config.watched_wallets,
             "websocket_url": self.config.websocket_url,
@@ -302,22 +602,12 @@ class HyperLiquidWalletTracker(LoggerMixin):
                 "whale": self.config.thresholds.whale_threshold
             },
             "channels": {
-                "discord": {
-                    "enabled": self.config.discord.enabled,
-                    "configured": bool(self.config.discord.webhook_url)
-                },
-                "telegram": {
-                    "enabled": self.config.telegram.enabled,
-                    "configured": bool(self.config.telegram.bot_token and self.config.telegram.chat_id)
-                },
-                "email": {
-                    "enabled": self.config.email.enabled,
-                    "configured": bool(self.config.email.username and self.config.email.to_addrs)
-                },
-                "webhook": {
-                    "enabled": self.config.webhook.enabled,
-                    "configured": bool(self.config.webhook.url)
+                name: {
+                    "enabled": channel.enabled,
+                    "configured": bool(is_configured(channel))
                 }
+                for name, is_configured in _CHANNEL_PROBES
+                for channel in (getattr(self.config, name),)
             },
             "monitoring": {
                 "enable_metrics": self.config.monitoring.enable_metrics,
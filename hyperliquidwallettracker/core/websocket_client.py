@@ -8,6 +8,7 @@ health monitoring, and comprehensive error handling.
 import asyncio
 import json
 import logging
+import re
 import time
 from dataclasses import dataclass, field
 from typing import Dict, Set, Optional, Callable, Any
@@ -18,9 +19,24 @@ from websockets.exceptions import ConnectionClosed, WebSocketException
 
 from .config import HyperLiquidConfig
 from ..utils.logging import get_logger
+from ..utils.serialization import json_dumps, json_loads
 
 logger = get_logger(__name__)
 
+# Channels carrying per-wallet activity; their name is the event "type"
+_WALLET_CHANNELS = ("userFills", "userEvents", "orderUpdates")
+
+# Channel name of a frame that starts with its "channel" key, as Hyperliquid
+# frames do; read without decoding the rest of the payload
+_LEADING_CHANNEL_RE = re.compile(r'\s*\{\s*"channel"\s*:\s*"([^"\\]*)"')
+
+# Subscription requests sent together, and the pause between batches
+_SUBSCRIBE_BATCH_SIZE = 20
+_SUBSCRIBE_BATCH_DELAY = 0.3
+
+# Frames read from the socket but not yet handled; the reader waits when full
+_RX_QUEUE_MAXSIZE = 1024
+
 
 @dataclass
 class ConnectionStats:
@@ -29,13 +45,22 @@ class ConnectionStats:
     total_messages: int = 0
     successful_parses: int = 0
     failed_parses: int = 0
-    last_message_time: Optional[datetime] = None
+    # Wall clock time of the last message in integer nanoseconds, 0 if none
+    last_message_time_ns: int = 0
     reconnect_count: int = 0
     subscription_count: int = 0
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     wallet_events: Dict[str, int] = field(default_factory=dict)
+    skipped_frames: int = 0
     last_health_check: Optional[datetime] = None
     consecutive_failures: int = 0
+    
+    @property
+    def last_message_time(self) -> Optional[datetime]:
+        """Time of the last message as an aware UTC datetime, if any."""
+        if not self.last_message_time_ns:
+            return None
+        return datetime.fromtimestamp(self.last_message_time_ns / 1e9, timezone.utc)
 
 
 class WebSocketClient:
@@ -71,9 +96,17 @@ class WebSocketClient:
         self.subscribed_wallets: Set[str] = set()
         self.wallet_subscriptions: Dict[str, Set[str]] = {}
         
+        # Wallet channels outside the watched event types; their frames are
+        # dropped before JSON decoding
+        event_types = config.get_event_types()
+        self._skipped_channels = (
+            frozenset(_WALLET_CHANNELS).difference(event_types) if event_types else frozenset()
+        )
+        
         # Initialize wallet tracking
         for wallet in config.watched_wallets:
-            self.stats.wallet_events[wallet] = 0
+            # Keyed in lower case, matching the case-insensitive wallet filter
+            self.stats.wallet_events[wallet.lower()] = 0
     
     async def connect(self) -> bool:
         """
@@ -122,8 +155,8 @@ class WebSocketClient:
             logger.error("WebSocket not connected, cannot subscribe")
             return False
         
-        sub_key = f"{channel_type}:{wallet}"
-        if sub_key in self.subscribed_wallets:
+        channel_wallets = self.wallet_subscriptions.get(channel_type)
+        if channel_wallets is not None and wallet in channel_wallets:
             return True
         
         try:
@@ -132,12 +165,12 @@ class WebSocketClient:
                 "subscription": {"type": channel_type, "user": wallet}
             }
             
-            await self.websocket.send(json.dumps(subscription_msg))
-            self.subscribed_wallets.add(sub_key)
+            await self.websocket.send(json_dumps(subscription_msg))
+            self.subscribed_wallets.add(f"{channel_type}:{wallet}")
             
-            if channel_type not in self.wallet_subscriptions:
-                self.wallet_subscriptions[channel_type] = set()
-            self.wallet_subscriptions[channel_type].add(wallet)
+            if channel_wallets is None:
+                channel_wallets = self.wallet_subscriptions.setdefault(channel_type, set())
+            channel_wallets.add(wallet)
             
             self.stats.subscription_count += 1
             logger.info(f"Subscribed to {channel_type} for wallet: {wallet[:8]}...")
@@ -159,18 +192,25 @@ class WebSocketClient:
             logger.error("WebSocket not connected, cannot subscribe")
             return False
         
-        channel_types = ["userFills", "userEvents", "orderUpdates"]
+        subscriptions = [
+            (wallet, channel_type)
+            for wallet in self.config.watched_wallets
+            for channel_type in _WALLET_CHANNELS
+        ]
         success_count = 0
-        total_subscriptions = len(self.config.watched_wallets) * len(channel_types)
+        total_subscriptions = len(subscriptions)
         
         logger.info(f"Setting up {total_subscriptions} subscriptions...")
         
-        for wallet in self.config.watched_wallets:
-            for channel_type in channel_types:
-                success = await self.subscribe_to_wallet(wallet, channel_type)
-                if success:
-                    success_count += 1
-                await asyncio.sleep(0.3)  # Rate limiting
+        # Send each batch in one burst, pausing only between batches
+        for start in range(0, total_subscriptions, _SUBSCRIBE_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(_SUBSCRIBE_BATCH_DELAY)  # Rate limiting
+            batch = subscriptions[start:start + _SUBSCRIBE_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(self.subscribe_to_wallet(wallet, channel_type) for wallet, channel_type in batch)
+            )
+            success_count += sum(results)
         
         logger.info(f"Subscription complete: {success_count}/{total_subscriptions} successful")
         return success_count > 0
@@ -192,7 +232,7 @@ class WebSocketClient:
                 "id": int(time.time() * 1000)
             }
             
-            await self.websocket.send(json.dumps(ping_message))
+            await self.websocket.send(json_dumps(ping_message))
             await asyncio.sleep(0.1)  # Allow response
             
             self.stats.last_health_check = datetime.now(timezone.utc)
@@ -246,30 +286,36 @@ class WebSocketClient:
         """
         try:
             self.stats.total_messages += 1
-            self.stats.last_message_time = datetime.now(timezone.utc)
+            self.stats.last_message_time_ns = time.time_ns()
             
-            raw_event = json.loads(message)
+            if self._skipped_channels and isinstance(message, str):
+                match = _LEADING_CHANNEL_RE.match(message)
+                if match and match.group(1) in self._skipped_channels:
+                    self.stats.skipped_frames += 1
+                    return
+            
+            raw_event = json_loads(message)
             channel = raw_event.get("channel", "unknown")
             
             if channel == "error":
                 error_msg = raw_event.get("data", "Unknown error")
-                logger.error(f"Server Error: {error_msg}")
+                logger.error("Server Error: %s", error_msg)
                 return
             
             elif channel == "subscriptionResponse":
                 await self._handle_subscription_response(raw_event)
                 return
             
-            elif channel in ["userFills", "userEvents", "orderUpdates"]:
+            elif channel in _WALLET_CHANNELS:
                 await self._handle_wallet_event(raw_event, channel)
             
             else:
-                logger.debug(f"General event on {channel}")
+                logger.debug("General event on %s", channel)
                 
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON received: {e}")
+        except json.JSONDecodeError as e:  # orjson's decode error subclasses this
+            logger.error("Invalid JSON received: %s", e)
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
+            logger.error("Error handling message: %s", e)
     
     async def _handle_subscription_response(self, raw_event: Dict[str, Any]):
         """Handle subscription response messages."""
@@ -280,26 +326,31 @@ class WebSocketClient:
                 logger.debug("Subscription confirmed")
             else:
                 error = response_data.get("error", "Unknown subscription error")
-                logger.error(f"Subscription failed: {error}")
+                logger.error("Subscription failed: %s", error)
     
     async def _handle_wallet_event(self, raw_event: Dict[str, Any], channel: str):
         """Handle wallet-specific events."""
         event_data = raw_event.get("data")
-        wallet = (
-            raw_event.get("user") or
-            raw_event.get("wallet") or
-            self._extract_wallet_from_event(event_data, raw_event)
-        )
+        wallet = raw_event.get("user") or raw_event.get("wallet")
+        if not wallet and isinstance(event_data, dict):
+            # Hyperliquid puts the address in data.user; checking it directly
+            # avoids walking every candidate field for unwatched wallets
+            user = event_data.get("user")
+            if isinstance(user, str):
+                wallet = user
+        if not wallet:
+            wallet = self._extract_wallet_from_event(event_data, raw_event)
         
-        if not wallet or wallet not in self.config.watched_wallets:
-            logger.debug(f"Filtering out event from non-watched wallet: {wallet}")
+        if not wallet or not self.config.is_watched(wallet):
+            logger.debug("Filtering out event from non-watched wallet: %s", wallet)
             return
         
         # Update wallet statistics
-        if wallet in self.stats.wallet_events:
-            self.stats.wallet_events[wallet] += 1
+        wallet_key = wallet.lower()
+        if wallet_key in self.stats.wallet_events:
+            self.stats.wallet_events[wallet_key] += 1
         
-        logger.debug(f"Processing {channel} for wallet: {wallet[:8]}...")
+        logger.debug("Processing %s for wallet: %.8s...", channel, wallet)
         
         try:
             if isinstance(event_data, list):
@@ -308,10 +359,10 @@ class WebSocketClient:
             elif isinstance(event_data, dict):
                 await self._process_single_event(event_data, channel, wallet, channel)
             else:
-                logger.warning(f"Unexpected event data format on {channel}: {type(event_data)}")
+                logger.warning("Unexpected event data format on %s: %s", channel, type(event_data))
                 
         except Exception as e:
-            logger.error(f"Error processing {channel} event: {e}")
+            logger.error("Error processing %s event: %s", channel, e)
     
     async def _process_single_event(
         self, 
@@ -323,7 +374,7 @@ class WebSocketClient:
         """Process a single event."""
         try:
             if not isinstance(event_data, dict):
-                logger.warning(f"Event {event_id} is not a dict: {type(event_data)}")
+                logger.warning("Event %s is not a dict: %s", event_id, type(event_data))
                 return
             
             # Create event object
@@ -331,8 +382,7 @@ class WebSocketClient:
                 "type": channel,
                 "wallet": wallet,
                 "data": event_data,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "raw": event_data
+                "timestamp_ns": time.time_ns()
             }
             
             self.stats.successful_parses += 1
@@ -341,11 +391,11 @@ class WebSocketClient:
             if self.event_handler:
                 await self.event_handler(event)
             
-            logger.info(f"Processed {len([event])} event(s) for {wallet[:8]}... on {channel}")
+            logger.info("Processed 1 event for %.8s... on %s", wallet, channel)
             
         except Exception as e:
             self.stats.failed_parses += 1
-            logger.error(f"Error processing event {event_id} for {wallet[:8]}: {e}")
+            logger.error("Error processing event %s for %.8s: %s", event_id, wallet, e)
     
     def _extract_wallet_from_event(self, event_data: Any, raw_event: Dict[str, Any]) -> Optional[str]:
         """Extract wallet address from event data."""
@@ -399,8 +449,7 @@ class WebSocketClient:
                         logger.info("Listening for events...")
                         
                         # Message processing loop
-                        async for message in self.websocket:
-                            await self.handle_message(message)
+                        await self._receive_messages()
                     else:
                         logger.error("Failed to establish subscriptions")
                         continue
@@ -438,6 +487,41 @@ class WebSocketClient:
                 
                 await asyncio.sleep(reconnect_delay)
     
+    async def _receive_messages(self):
+        """
+        Read frames from the open connection until it closes.
+        
+        Frames are buffered in a bounded queue and handled by a separate task,
+        so a slow event handler does not stop the socket from being drained.
+        Frames already read when the connection drops are still handled.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_RX_QUEUE_MAXSIZE)
+        consumer = asyncio.create_task(self._consume_messages(queue))
+        
+        try:
+            try:
+                async for message in self.websocket:
+                    await queue.put(message)
+            except (ConnectionClosed, WebSocketException):
+                await queue.join()
+                raise
+            await queue.join()
+        finally:
+            consumer.cancel()
+            try:
+                await consumer
+            except asyncio.CancelledError:
+                pass
+    
+    async def _consume_messages(self, queue: asyncio.Queue):
+        """Handle buffered frames in arrival order."""
+        while True:
+            message = await queue.get()
+            try:
+                await self.handle_message(message)
+            finally:
+                queue.task_done()
+    
     async def shutdown(self):
         """Graceful shutdown of WebSocket client."""
         logger.info("Shutting down WebSocket client...")
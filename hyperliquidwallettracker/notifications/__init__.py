@@ -8,6 +8,7 @@ and retry logic.
 
 from .dispatcher import NotificationDispatcher
 from .channels import (
+    close_sessions,
     send_discord_notification,
     send_telegram_notification, 
     send_email_notification,
@@ -20,4 +21,5 @@ __all__ = [
     "send_telegram_notification",
     "send_email_notification", 
     "send_webhook_notification",
+    "close_sessions",
 ]
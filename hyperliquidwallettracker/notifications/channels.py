@@ -8,15 +8,129 @@ Discord, Telegram, Email, and Webhook channels.
 import asyncio
 import aiohttp
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 
 from ..utils.logging import get_logger
+from ..utils.serialization import json_dumps_bytes
 
 logger = get_logger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# HTTP session shared by all channels so connections to the same host are
+# kept alive between notifications; created on first use
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session, creating it if needed.
+    
+    Must be called from a running event loop.
+    
+    Returns:
+        Open aiohttp session with a keep-alive connection pool
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    return _session
+
+
+# SMTP connection kept open between emails, the (server, port, username) it
+# was opened for, and a lock serializing its use
+_smtp_conn: Optional[smtplib.SMTP] = None
+_smtp_key: Optional[Tuple[str, int, Optional[str]]] = None
+_smtp_lock = threading.Lock()
+
+
+def _smtp_connect(email_config: Any) -> smtplib.SMTP:
+    """Open and, when credentials are set, authenticate an SMTP connection."""
+    server = smtplib.SMTP(email_config.smtp_server, email_config.smtp_port)
+    try:
+        if email_config.username and email_config.password:
+            server.starttls()
+            server.login(email_config.username, email_config.password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _close_smtp():
+    """Close the shared SMTP connection; callers must hold ``_smtp_lock``."""
+    global _smtp_conn, _smtp_key
+    server, _smtp_conn, _smtp_key = _smtp_conn, None, None
+    if server is not None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+def _close_smtp_locked():
+    """Close the shared SMTP connection once no send is using it."""
+    with _smtp_lock:
+        _close_smtp()
+
+
+def _get_smtp_connection(email_config: Any) -> smtplib.SMTP:
+    """
+    Get an open SMTP connection for the given settings, reusing the last one.
+    
+    A kept connection is checked with NOOP first and replaced if the server
+    has dropped it or the settings changed. Callers must hold ``_smtp_lock``.
+    
+    Args:
+        email_config: Email configuration object
+        
+    Returns:
+        Connected, authenticated SMTP client
+    """
+    global _smtp_conn, _smtp_key
+    key = (email_config.smtp_server, email_config.smtp_port, email_config.username)
+    
+    if _smtp_conn is not None:
+        if _smtp_key == key:
+            try:
+                if _smtp_conn.noop()[0] == 250:
+                    return _smtp_conn
+            except (smtplib.SMTPException, OSError):
+                pass
+        _close_smtp()
+    
+    _smtp_conn = _smtp_connect(email_config)
+    _smtp_key = key
+    return _smtp_conn
+
+
+def _send_email_sync(email_config: Any, msg: MIMEMultipart):
+    """Send a message over the shared SMTP connection, reconnecting once if dropped."""
+    with _smtp_lock:
+        server = _get_smtp_connection(email_config)
+        try:
+            server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            _close_smtp()
+            _get_smtp_connection(email_config).send_message(msg)
+
+
+async def close_sessions():
+    """Close the shared HTTP session and SMTP connection; later sends reopen them."""
+    global _session
+    session, _session = _session, None
+    if session is not None and not session.closed:
+        await session.close()
+    
+    await asyncio.get_running_loop().run_in_executor(None, _close_smtp_locked)
+
 
 async def send_discord_notification(webhook_url: str, content: Dict[str, Any]) -> bool:
     """
@@ -34,15 +148,18 @@ async def send_discord_notification(webhook_url: str, content: Dict[str, Any]) -
         return False
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(webhook_url, json=content) as response:
-                if response.status == 204:
-                    logger.info("Discord notification sent successfully")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Discord notification failed: {response.status} - {error_text}")
-                    return False
+        async with _get_session().post(
+            webhook_url,
+            data=json_dumps_bytes(content),
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status == 204:
+                logger.info("Discord notification sent successfully")
+                return True
+            else:
+                error_text = await response.text()
+                logger.error(f"Discord notification failed: {response.status} - {error_text}")
+                return False
                     
     except Exception as e:
         logger.error(f"Error sending Discord notification: {e}")
@@ -78,15 +195,18 @@ async def send_telegram_notification(
             "disable_web_page_preview": True
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status == 200:
-                    logger.info("Telegram notification sent successfully")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Telegram notification failed: {response.status} - {error_text}")
-                    return False
+        async with _get_session().post(
+            url,
+            data=json_dumps_bytes(payload),
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status == 200:
+                logger.info("Telegram notification sent successfully")
+                return True
+            else:
+                error_text = await response.text()
+                logger.error(f"Telegram notification failed: {response.status} - {error_text}")
+                return False
                     
     except Exception as e:
         logger.error(f"Error sending Telegram notification: {e}")
@@ -129,15 +249,12 @@ async def send_email_notification(
         msg.attach(text_part)
         msg.attach(html_part)
         
-        # Send email
-        with smtplib.SMTP(email_config.smtp_server, email_config.smtp_port) as server:
-            if email_config.username and email_config.password:
-                server.starttls()
-                server.login(email_config.username, email_config.password)
-            
-            server.send_message(msg)
-            logger.info("Email notification sent successfully")
-            return True
+        # smtplib is blocking, so keep the exchange off the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, _send_email_sync, email_config, msg
+        )
+        logger.info("Email notification sent successfully")
+        return True
             
     except Exception as e:
         logger.error(f"Error sending email notification: {e}")
@@ -172,20 +289,18 @@ async def send_webhook_notification(
         }
         request_headers.update(headers)
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                webhook_url, 
-                json=content, 
-                headers=request_headers,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status in [200, 201, 202, 204]:
-                    logger.info("Webhook notification sent successfully")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Webhook notification failed: {response.status} - {error_text}")
-                    return False
+        async with _get_session().post(
+            webhook_url, 
+            data=json_dumps_bytes(content),
+            headers=request_headers
+        ) as response:
+            if response.status in [200, 201, 202, 204]:
+                logger.info("Webhook notification sent successfully")
+                return True
+            else:
+                error_text = await response.text()
+                logger.error(f"Webhook notification failed: {response.status} - {error_text}")
+                return False
                     
     except asyncio.TimeoutError:
         logger.error("Webhook notification timeout")
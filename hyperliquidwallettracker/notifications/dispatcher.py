@@ -10,11 +10,13 @@ from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 
+from ..alerts.formatter import Notification
 from ..core.config import HyperLiquidConfig
 from ..utils.logging import get_logger
 from ..utils.rate_limiter import rate_limiters
 from ..utils.metrics import metrics_collector
 from .channels import (
+    close_sessions,
     send_discord_notification,
     send_telegram_notification,
     send_email_notification,
@@ -55,7 +57,7 @@ class NotificationDispatcher:
             config: HyperLiquidWalletTracker configuration
         """
         self.config = config
-        self.notification_queue: List[Dict[str, Any]] = []
+        self.notification_queue: List[Notification] = []
         self.retry_queue: List[Dict[str, Any]] = []
         self.max_retries = 3
         self.retry_delay_base = 5  # seconds
@@ -111,14 +113,21 @@ class NotificationDispatcher:
             except asyncio.CancelledError:
                 pass
         
+        await close_sessions()
+        
         logger.info("Notification dispatcher stopped")
     
-    async def dispatch_notification(self, notification: Dict[str, Any]) -> List[NotificationResult]:
+    async def dispatch_notification(
+        self, 
+        notification: Notification, 
+        parallel: bool = False
+    ) -> List[NotificationResult]:
         """
         Dispatch a notification to all enabled channels.
         
         Args:
             notification: Notification to dispatch
+            parallel: Send to all channels concurrently instead of one by one
             
         Returns:
             List of notification results
@@ -126,14 +135,15 @@ class NotificationDispatcher:
         results = []
         
         # Get formatted content
-        formatted = notification.get("formatted", {})
-        context = notification.get("context")
+        formatted = notification.formatted
+        context = notification.context
         
         if not context:
             logger.error("No context in notification")
             return results
         
         wallet = context.wallet
+        sends = []
         
         # Send to each enabled channel
         for channel, enabled in self.channel_availability.items():
@@ -144,14 +154,26 @@ class NotificationDispatcher:
                 logger.warning(f"No formatted content for channel: {channel}")
                 continue
             
-            result = await self._send_to_channel(
+            try:
+                content = formatted[channel]
+            except Exception as e:
+                logger.error(f"Error formatting {channel} notification: {e}")
+                continue
+            
+            sends.append(self._send_to_channel(
                 channel=channel,
                 wallet=wallet,
-                content=formatted[channel],
+                content=content,
                 notification=notification
-            )
-            
-            results.append(result)
+            ))
+        
+        if parallel:
+            # Channels are independent, so their requests can overlap;
+            # _send_to_channel reports failures as results rather than raising
+            return list(await asyncio.gather(*sends))
+        
+        for send in sends:
+            results.append(await send)
         
         return results
     
@@ -160,7 +182,7 @@ class NotificationDispatcher:
         channel: str, 
         wallet: str, 
         content: Any, 
-        notification: Dict[str, Any]
+        notification: Notification
     ) -> NotificationResult:
         """Send notification to a specific channel."""
         start_time = datetime.now(timezone.utc)
@@ -172,7 +194,7 @@ class NotificationDispatcher:
                 can_send, wait_time = rate_limiter.can_send_request(channel, wallet)
                 if not can_send:
                     # Add to pending queue
-                    rate_limiter.add_pending_event(channel, wallet, notification)
+                    rate_limiter.add_pending_event(channel, wallet, notification.to_dict())
                     self.stats["rate_limited"] += 1
                     
                     return NotificationResult(
@@ -263,7 +285,7 @@ class NotificationDispatcher:
         channel: str, 
         wallet: str, 
         content: Any, 
-        notification: Dict[str, Any]
+        notification: Notification
     ):
         """Add notification to retry queue."""
         retry_item = {
@@ -5,13 +5,19 @@ This package contains utility functions and classes for logging, metrics,
 data processing, and other common functionality.
 """
 
+from .eventloop import run_async
 from .logging import get_logger, setup_logging
 from .metrics import MetricsCollector
 from .rate_limiter import RateLimiter
+from .serialization import json_dumps, json_dumps_bytes, json_loads
 
 __all__ = [
     "get_logger",
     "setup_logging", 
     "MetricsCollector",
     "RateLimiter",
+    "json_dumps",
+    "json_dumps_bytes",
+    "json_loads",
+    "run_async",
 ]
@@ -0,0 +1,27 @@
+"""
+Event loop helpers for HyperLiquidWalletTracker.
+
+This module runs coroutines on uvloop's libuv-based event loop when it is
+installed, falling back to the standard asyncio loop otherwise (including on
+Windows, where uvloop is unavailable).
+"""
+
+from typing import Any, Coroutine
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion, on uvloop's event loop when installed.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        import asyncio
+        return asyncio.run(coro)
+    return uvloop.run(coro)
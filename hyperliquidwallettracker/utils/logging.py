@@ -11,6 +11,8 @@ from typing import Any, Dict, Optional
 import structlog
 from structlog.stdlib import LoggerFactory
 
+from .serialization import json_dumps
+
 
 def setup_logging(
     level: str = "INFO",
@@ -30,7 +32,9 @@ def setup_logging(
         include_logger_name: Include logger name in output
     """
     # Configure structlog
-    processors = []
+    # Drop events below the configured level before any other processing, and
+    # render %-style positional arguments only for events that are emitted
+    processors = [structlog.stdlib.filter_by_level]
     
     if include_timestamp:
         processors.append(structlog.processors.TimeStamper(fmt="ISO"))
@@ -42,12 +46,14 @@ def setup_logging(
         processors.append(structlog.stdlib.add_logger_name)
     
     processors.extend([
+        structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
     ])
     
     if format_type == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        # Render through orjson when it is installed
+        processors.append(structlog.processors.JSONRenderer(serializer=json_dumps))
     else:
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
     
@@ -87,6 +93,9 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
 class LoggerMixin:
     """Mixin class to add structured logging to any class."""
     
+    # No per-instance state, so slotted subclasses stay free of a __dict__
+    __slots__ = ()
+    
     @property
     def logger(self) -> structlog.stdlib.BoundLogger:
         """Get logger for this class."""
@@ -168,6 +168,18 @@ class MetricsCollector:
         self.cpu_usage_gauge.set(self.system_metrics.cpu_usage_percent)
         self.active_connections_gauge.set(self.system_metrics.active_connections)
     
+    def add_events_processed(self, count: int = 1):
+        """
+        Add to the running total of processed events.
+        
+        Unlike ``update_system_metrics`` this builds no keyword dict and does
+        no ``hasattr`` probing, so it is cheap enough for per-event callers.
+        
+        Args:
+            count: Number of events processed since the last call
+        """
+        self.system_metrics.total_events_processed += count
+    
     def update_business_metrics(self, **kwargs):
         """Update business-level metrics."""
         for key, value in kwargs.items():
@@ -182,7 +194,8 @@ class MetricsCollector:
         event_type: str, 
         wallet: str, 
         status: str = "success",
-        duration: Optional[float] = None
+        duration: Optional[float] = None,
+        count: int = 1
     ):
         """
         Record that an event was processed.
@@ -192,12 +205,13 @@ class MetricsCollector:
             wallet: Wallet address
             status: Processing status (success, error, filtered)
             duration: Processing duration in seconds
+            count: Number of events to record (for pre-aggregated counts)
         """
         self.events_processed_counter.labels(
             event_type=event_type,
             wallet=wallet[:8] + "...",
             status=status
-        ).inc()
+        ).inc(count)
         
         if duration is not None:
             self.events_processing_duration.labels(
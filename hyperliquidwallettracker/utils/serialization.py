@@ -0,0 +1,98 @@
+"""
+JSON serialization helpers for HyperLiquidWalletTracker.
+
+This module uses orjson when it is installed and falls back to the standard
+library ``json`` module otherwise, so hot paths can serialize payloads without
+caring which backend is available.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+    _ORJSON_INDENT_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_INDENT_2
+
+Default = Optional[Callable[[Any], Any]]
+
+
+def _default(value: Any) -> Any:
+    """Serialize values the stdlib encoder does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_dumps_bytes(obj: Any, indent: bool = False, default: Default = None) -> bytes:
+    """
+    Serialize an object to JSON encoded as UTF-8 bytes.
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Fallback for values JSON cannot encode natively
+    
+    Returns:
+        JSON document as bytes, ready to be sent as a request body
+    """
+    if HAS_ORJSON:
+        options = _ORJSON_INDENT_OPTIONS if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=default, option=options)
+    return _stdlib_dumps(obj, indent, default).encode("utf-8")
+
+
+def json_dumps(obj: Any, indent: bool = False, default: Default = None) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Fallback for values JSON cannot encode natively
+    
+    Returns:
+        JSON document as str
+    """
+    if HAS_ORJSON:
+        options = _ORJSON_INDENT_OPTIONS if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=default, option=options).decode("utf-8")
+    return _stdlib_dumps(obj, indent, default)
+
+
+def _stdlib_dumps(obj: Any, indent: bool, default: Default) -> str:
+    """Serialize with the standard library, matching orjson's output layout."""
+    if default is not None:
+        # orjson encodes datetimes itself and only consults default for the rest
+        user_default = default
+        
+        def default(value: Any) -> Any:
+            if isinstance(value, datetime):
+                return value.isoformat()
+            return user_default(value)
+    
+    if indent:
+        return json.dumps(obj, default=default or _default, indent=2)
+    return json.dumps(obj, default=default or _default, separators=(",", ":"))
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Deserialize a JSON document.
+    
+    Args:
+        data: JSON document as str or bytes
+    
+    Returns:
+        Deserialized object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)